@@ -28,6 +28,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,
     )
 
     # Required API keys
@@ -53,3 +54,9 @@ def get_settings() -> Settings:
 
 # Global settings instance
 settings = get_settings()
+
+# Settings resolved once at import for hot-path readers
+CORS_ORIGINS: tuple[str, ...] = tuple(settings.cors_origins)
+HOST: str = settings.host
+PORT: int = settings.port
+DEBUG: bool = settings.debug
@@ -4,15 +4,32 @@ MedVoice FastAPI Application
 Main entry point for the voice intake backend.
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.app.config import get_settings
+from backend.app.config import CORS_ORIGINS, DEBUG, HOST, PORT
 from backend.app.routes import api_router
+from backend.app.routes.sessions import cancel_startup_tasks
+from backend.app.services.bot_runner import graceful_shutdown_all
 from backend.app.services.session_store import session_store
+from backend.app.voice.room import close_session
+
+# Invariant health payload, encoded once
+_HEALTH_BODY = b'{"status":"healthy","service":"medvoice-api"}'
+
+# Seconds between sweeps for expired sessions
+SESSION_SWEEP_INTERVAL = 60
+
+
+async def _sweep_expired_sessions() -> None:
+    """Periodically evict idle sessions from the in-memory store."""
+    while True:
+        await asyncio.sleep(SESSION_SWEEP_INTERVAL)
+        session_store.evict_expired()
 
 
 @asynccontextmanager
@@ -23,12 +40,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Handles startup and shutdown tasks.
     """
     # Startup
-    settings = get_settings()
-    print(f"Starting MedVoice API (debug={settings.debug})")
+    print(f"Starting MedVoice API (debug={DEBUG})")
+    sweeper = asyncio.create_task(_sweep_expired_sessions())
     yield
     # Shutdown
+    sweeper.cancel()
+    with suppress(asyncio.CancelledError):
+        await sweeper
+    await cancel_startup_tasks()
+    stopped = await graceful_shutdown_all()
+    print(f"Stopped {stopped} bots")
     count = await session_store.cleanup_all()
     print(f"Cleaned up {count} sessions")
+    await close_session()
 
 
 def create_app() -> FastAPI:
@@ -38,8 +62,6 @@ def create_app() -> FastAPI:
     Returns:
         Configured FastAPI instance.
     """
-    settings = get_settings()
-
     app = FastAPI(
         title="MedVoice API",
         description="Voice-first medical intake assistant",
@@ -47,10 +69,10 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    # CORS middleware - allow all origins in development
+    # CORS middleware - allow only the configured origins
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        allow_origins=list(CORS_ORIGINS),
         allow_credentials=False,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -61,15 +83,27 @@ def create_app() -> FastAPI:
 
     # Health check endpoint
     @app.get("/health", tags=["health"])
-    async def health_check() -> dict:
+    async def health_check() -> Response:
         """Health check endpoint."""
-        return {
-            "status": "healthy",
-            "service": "medvoice-api",
-        }
+        return Response(content=_HEALTH_BODY, media_type="application/json")
 
     return app
 
 
 # Application instance
 app = create_app()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # I/O-bound workload: use the libuv loop and C HTTP parser
+    uvicorn.run(
+        "backend.app.main:app",
+        host=HOST,
+        port=PORT,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        reload=DEBUG,
+    )
@@ -7,12 +7,19 @@ Pydantic schemas for structured patient intake data.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.app.models.messages import utc_now
+
+# Shared config for small intake value objects: validated once, immutable
+_VALUE_CONFIG = ConfigDict(extra="forbid", frozen=True, validate_assignment=False)
 
 
 class Demographics(BaseModel):
     """Patient demographic information."""
 
+    model_config = _VALUE_CONFIG
+
     full_name: Optional[str] = None
     date_of_birth: Optional[str] = None  # ISO format: YYYY-MM-DD
     phone: Optional[str] = None
@@ -22,6 +29,8 @@ class Demographics(BaseModel):
 class Visit(BaseModel):
     """Visit reason and symptom information."""
 
+    model_config = _VALUE_CONFIG
+
     chief_complaint: Optional[str] = None
     symptoms: list[str] = Field(default_factory=list)
     duration: Optional[str] = None
@@ -31,6 +40,8 @@ class Visit(BaseModel):
 class MedicalHistory(BaseModel):
     """Patient medical history."""
 
+    model_config = _VALUE_CONFIG
+
     chronic_conditions: list[str] = Field(default_factory=list)
     surgeries: list[str] = Field(default_factory=list)
     hospitalizations: list[str] = Field(default_factory=list)
@@ -39,6 +50,8 @@ class MedicalHistory(BaseModel):
 class Medication(BaseModel):
     """Single medication entry."""
 
+    model_config = _VALUE_CONFIG
+
     name: str
     dosage: Optional[str] = None
 
@@ -46,6 +59,8 @@ class Medication(BaseModel):
 class Allergies(BaseModel):
     """Patient allergy information (critical section)."""
 
+    model_config = _VALUE_CONFIG
+
     drug_allergies: list[str] = Field(default_factory=list)
     food_allergies: list[str] = Field(default_factory=list)
     reactions: Optional[str] = None
@@ -54,16 +69,19 @@ class Allergies(BaseModel):
 class IntakeMetadata(BaseModel):
     """Metadata about the intake session."""
 
+    model_config = _VALUE_CONFIG
+
     duration_seconds: int = 0
     sections_completed: int = 0
     corrections_made: int = 0
+    failed_sections: list[str] = Field(default_factory=list)
 
 
 class IntakeData(BaseModel):
     """Complete intake data structure."""
 
     session_id: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
     status: str = "in_progress"  # in_progress, complete, abandoned
 
     demographics: Demographics = Field(default_factory=Demographics)
@@ -4,11 +4,18 @@ Message and Session Models
 Pydantic schemas for chat messages, conversation turns, and session state.
 """
 
-from datetime import datetime
+import time
+from datetime import UTC, datetime, timedelta
 from enum import Enum
+from functools import partial
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+
+# Current UTC time; bound once so default factories skip the attribute lookups
+utc_now = partial(datetime.now, UTC)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
 
 
 class SessionStatus(str, Enum):
@@ -37,7 +44,7 @@ class ChatMessage(BaseModel):
 
     role: str  # "user" or "assistant"
     content: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 class ConversationTurn(BaseModel):
@@ -46,20 +53,52 @@ class ConversationTurn(BaseModel):
     turn_id: int
     speaker: str  # "agent" or "patient"
     text: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp_ns: int = Field(default_factory=time.time_ns)  # Unix epoch, ns
     state: IntakeState
     extracted: Optional[dict[str, Any]] = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def _timestamp_to_ns(cls, data: Any) -> Any:
+        """Accept the serialized timestamp, so re-validated turns keep their time."""
+        if not isinstance(data, dict) or "timestamp" not in data:
+            return data
+        data = dict(data)
+        timestamp = data.pop("timestamp")
+        if "timestamp_ns" in data:
+            return data
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        if not isinstance(timestamp, datetime):
+            raise ValueError("timestamp must be a datetime or ISO 8601 string")
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=UTC)
+        data["timestamp_ns"] = (timestamp - _EPOCH) // timedelta(microseconds=1) * 1000
+        return data
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def timestamp(self) -> datetime:
+        """Turn time as a UTC datetime, built only when serialized."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=UTC)
+
 
 class SessionState(BaseModel):
-    """Current session state."""
+    """
+    Current session state.
+
+    Frozen snapshot of a stored session; SessionStore builds a fresh one
+    per read, so callers can share it without copying.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     session_id: str
     status: SessionStatus = SessionStatus.ACTIVE
     current_state: IntakeState = IntakeState.GREETING
     turns: list[ConversationTurn] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
 
 class CreateSessionResponse(BaseModel):
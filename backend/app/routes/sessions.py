@@ -4,6 +4,9 @@ Session Management Routes
 Endpoints for creating, retrieving, and managing voice sessions.
 """
 
+import asyncio
+from contextlib import suppress
+
 from fastapi import APIRouter, HTTPException, status
 from loguru import logger
 
@@ -22,10 +25,51 @@ from backend.app.voice.room import create_daily_room
 
 router = APIRouter()
 
+# Module-bound logger; messages use deferred brace formatting
+_log = logger.bind(route="sessions")
+
+# In-flight bot startup tasks by session id; also keeps them referenced
+_startup_tasks: dict[str, asyncio.Task[None]] = {}
+
+
+async def _start_bot_safe(session_id: str, room_url: str) -> None:
+    """Start a bot, marking the session abandoned if startup fails."""
+    try:
+        await start_bot_for_session(session_id, room_url)
+        _log.info("Bot started for session {}", session_id)
+    except Exception as e:
+        _log.error("Failed to start bot: {}", e)
+        await session_store.update(session_id, status=SessionStatus.ABANDONED)
+
+
+async def _cancel_startup(session_id: str) -> None:
+    """Cancel a session's pending bot startup and wait for it to unwind."""
+    task = _startup_tasks.pop(session_id, None)
+    if task is not None:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+async def cancel_startup_tasks() -> int:
+    """
+    Cancel every pending bot startup.
+
+    Run at shutdown before stopping bots, so no bot starts after the
+    stop sweep.
+
+    Returns:
+        Number of startups cancelled.
+    """
+    session_ids = list(_startup_tasks)
+    await asyncio.gather(*(_cancel_startup(sid) for sid in session_ids))
+    return len(session_ids)
+
 
 @router.post(
     "/",
     response_model=SessionResponse,
+    response_model_exclude_none=True,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new voice session",
 )
@@ -56,13 +100,11 @@ async def create_session() -> SessionResponse:
 
     session = await session_store.create(room_url=room_url)
 
-    # Start bot in background
-    try:
-        await start_bot_for_session(session.session_id, room_url)
-        logger.info(f"Bot started for session {session.session_id}")
-    except Exception as e:
-        logger.error(f"Failed to start bot: {e}")
-        # Continue anyway - bot can be started manually if needed
+    # Start bot in background; clients poll GET /sessions/{id} for status
+    session_id = session.session_id
+    task = asyncio.create_task(_start_bot_safe(session_id, room_url))
+    _startup_tasks[session_id] = task
+    task.add_done_callback(lambda _: _startup_tasks.pop(session_id, None))
 
     return SessionResponse(
         session_id=session.session_id,
@@ -75,6 +117,7 @@ async def create_session() -> SessionResponse:
 @router.get(
     "/{session_id}",
     response_model=SessionState,
+    response_model_exclude_none=True,
     summary="Get session state",
 )
 async def get_session(session_id: str) -> SessionState:
@@ -155,7 +198,9 @@ async def end_session(session_id: str) -> None:
             detail=f"Session {session_id} not found",
         )
 
-    # Stop bot if running
+    # Stop bot if running; a startup still in flight is cancelled first so
+    # the bot can't come up after the session is gone
+    await _cancel_startup(session_id)
     await stop_bot_for_session(session_id)
 
     # Mark as complete before deletion
@@ -166,6 +211,7 @@ async def end_session(session_id: str) -> None:
 @router.patch(
     "/{session_id}/status",
     response_model=SessionState,
+    response_model_exclude_none=True,
     summary="Update session status",
 )
 async def update_session_status(
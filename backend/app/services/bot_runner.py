@@ -3,9 +3,13 @@ Bot Runner Service
 
 Manages voice bot lifecycle for sessions.
 Runs bots in background tasks and tracks their state.
+
+Bots share the server's event loop (uvloop under uvicorn, see main.py and
+the start scripts); nothing here holds a loop reference of its own.
 """
 
 import asyncio
+from collections import deque
 from typing import Any
 
 from loguru import logger
@@ -17,6 +21,13 @@ from backend.app.services.session_store import session_store
 # Global registry of active bots
 _active_bots: dict[str, "BotRunner"] = {}
 
+# Conversation retention caps per bot
+MAX_HISTORY_MESSAGES = 200
+MAX_HISTORY_CHARS = 50_000
+
+# Grace period for in-flight intake extractions at server shutdown
+SHUTDOWN_EXTRACTION_TIMEOUT = 5.0
+
 
 class BotRunner:
     """
@@ -28,8 +39,11 @@ class BotRunner:
     def __init__(self, session_id: str, room_url: str) -> None:
         self.session_id = session_id
         self.room_url = room_url
-        self.task: asyncio.Task | None = None
-        self.conversation_history: list[dict] = []
+        self.task: asyncio.Task[None] | None = None
+        self.conversation_history: deque[dict[str, Any]] = deque(
+            maxlen=MAX_HISTORY_MESSAGES
+        )
+        self._extraction: asyncio.Task[None] | None = None
         self._stopped = False
 
     async def start(self) -> None:
@@ -68,18 +82,25 @@ class BotRunner:
                 on_error=self._on_error,
             )
 
-            self.conversation_history = conversation
+            self._set_history(conversation)
 
-            # Extract intake data and update session
+            # Extract intake data and update session; shielded so a stop
+            # racing with completion does not kill the Gemini call
             if conversation and not self._stopped:
-                await self._extract_and_save_intake()
+                await asyncio.shield(self._start_extraction(SessionStatus.COMPLETE))
 
         except asyncio.CancelledError:
             logger.info(f"Bot cancelled for session {self.session_id}")
-            await session_store.update(
-                self.session_id,
-                status=SessionStatus.ABANDONED,
-            )
+            if self.conversation_history or self._extraction is not None:
+                # Best effort: persist whatever was collected. The task is
+                # held on self._extraction and finishes in the background,
+                # so stop() does not wait on the Gemini call.
+                self._start_extraction(SessionStatus.ABANDONED)
+            else:
+                await session_store.update(
+                    self.session_id,
+                    status=SessionStatus.ABANDONED,
+                )
         except Exception as e:
             logger.error(f"Bot error for session {self.session_id}: {e}")
             await session_store.update(
@@ -89,9 +110,20 @@ class BotRunner:
         finally:
             _active_bots.pop(self.session_id, None)
 
-    def _on_conversation_update(self, history: list[dict]) -> None:
+    def _set_history(self, history: list[dict[str, Any]]) -> None:
+        """Replace stored history, keeping only the most recent messages."""
+        conversation = self.conversation_history
+        conversation.clear()
+        conversation.extend(history[-MAX_HISTORY_MESSAGES:])
+
+        # Drop oldest messages until the character budget is met
+        total = sum(len(m.get("content") or "") for m in conversation)
+        while total > MAX_HISTORY_CHARS and conversation:
+            total -= len(conversation.popleft().get("content") or "")
+
+    def _on_conversation_update(self, history: list[dict[str, Any]]) -> None:
         """Callback when conversation updates."""
-        self.conversation_history = history.copy()
+        self._set_history(history)
         logger.debug(f"Conversation updated: {len(history)} messages")
 
     def _on_complete(self) -> None:
@@ -102,17 +134,36 @@ class BotRunner:
         """Callback on pipeline error."""
         logger.error(f"Pipeline error for {self.session_id}: {error}")
 
-    async def _extract_and_save_intake(self) -> None:
+    def _start_extraction(self, status: SessionStatus) -> asyncio.Task[None]:
+        """
+        Start intake extraction once; later callers share the same task.
+
+        Args:
+            status: Session status to record once extraction finishes.
+
+        Returns:
+            The extraction task.
+        """
+        if self._extraction is None:
+            self._extraction = asyncio.create_task(
+                self._extract_and_save_intake(status)
+            )
+        return self._extraction
+
+    async def _extract_and_save_intake(
+        self,
+        status: SessionStatus = SessionStatus.COMPLETE,
+    ) -> None:
         """Extract intake data from conversation and save to session."""
         try:
             from backend.app.services.intake_extractor import extract_intake_data
 
-            intake_data = await extract_intake_data(self.conversation_history)
+            intake_data = await extract_intake_data(list(self.conversation_history))
 
             # Update session with extracted data and conversation
             await session_store.update(
                 self.session_id,
-                status=SessionStatus.COMPLETE,
+                status=status,
             )
 
             # Store intake data in session (we'll add this field)
@@ -121,10 +172,10 @@ class BotRunner:
 
         except Exception as e:
             logger.error(f"Intake extraction failed: {e}")
-            # Still mark complete even if extraction fails
+            # Still record the final status even if extraction fails
             await session_store.update(
                 self.session_id,
-                status=SessionStatus.COMPLETE,
+                status=status,
             )
 
 
@@ -141,6 +192,16 @@ async def start_bot_for_session(session_id: str, room_url: str) -> BotRunner:
     """
     runner = BotRunner(session_id, room_url)
     await runner.start()
+
+    # Build the extraction model while the pipeline boots, so the end of the
+    # first conversation doesn't pay for the Gemini import and configuration.
+    try:
+        from backend.app.services.intake_extractor import warm_up
+
+        await asyncio.to_thread(warm_up)
+    except Exception as e:
+        logger.warning(f"Intake extractor warm-up failed: {e}")
+
     return runner
 
 
@@ -161,6 +222,23 @@ async def stop_bot_for_session(session_id: str) -> bool:
     return False
 
 
+async def graceful_shutdown_all() -> int:
+    """
+    Stop every active bot, letting in-flight extractions finish.
+
+    Returns:
+        Number of bots that were stopped.
+    """
+    runners = list(_active_bots.values())
+    await asyncio.gather(*(r.stop() for r in runners), return_exceptions=True)
+
+    # stop() leaves extraction running in the background; bound the wait
+    pending = [r._extraction for r in runners if r._extraction is not None]
+    if pending:
+        await asyncio.wait(pending, timeout=SHUTDOWN_EXTRACTION_TIMEOUT)
+    return len(runners)
+
+
 def get_active_bot(session_id: str) -> BotRunner | None:
     """Get active bot for a session."""
     return _active_bots.get(session_id)
@@ -4,10 +4,15 @@ Intake Data Extractor
 Extracts structured intake data from conversation history using LLM.
 """
 
+import asyncio
 import json
-from datetime import datetime
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
 
+import google.generativeai as genai
 from loguru import logger
+from pydantic import ValidationError
 
 from backend.app.config import get_settings
 from backend.app.models.intake import (
@@ -20,44 +25,72 @@ from backend.app.models.intake import (
     Visit,
 )
 
-EXTRACTION_PROMPT = """Extract medical intake information from this conversation.
-Return a JSON object with the following structure (use null for missing fields):
-
-{
-  "demographics": {
+# JSON schema for each intake section. Sections are extracted by separate,
+# concurrent calls so each response is small and one failure loses only
+# that section.
+SECTION_SCHEMAS = {
+    "demographics": """{
     "full_name": "string or null",
     "date_of_birth": "YYYY-MM-DD or null",
     "phone": "string or null",
     "email": "string or null"
-  },
-  "visit": {
+  }""",
+    "visit": """{
     "chief_complaint": "main reason for visit or null",
     "symptoms": ["list", "of", "symptoms"],
     "duration": "how long symptoms lasted or null",
     "severity": 1-10 or null
-  },
-  "medical_history": {
+  }""",
+    "medical_history": """{
     "chronic_conditions": ["diabetes", "hypertension", etc.],
     "surgeries": ["past surgeries"],
     "hospitalizations": ["past hospitalizations"]
-  },
-  "medications": [
+  }""",
+    "medications": """[
     {"name": "medication name", "dosage": "dosage or null"}
-  ],
-  "allergies": {
+  ]""",
+    "allergies": """{
     "drug_allergies": ["penicillin", etc.],
     "food_allergies": ["peanuts", etc.],
     "reactions": "description of reactions or null"
-  }
+  }""",
 }
 
+EXTRACTION_PROMPT = """Extract medical intake information from this conversation.
+Return a JSON object with the following structure (use null for missing fields):
+
+{{
+  "{section}": {schema}
+}}
+
 Only include information explicitly mentioned in the conversation.
-Return valid JSON only, no markdown or explanations.
 
 CONVERSATION:
 """
 
 
+@lru_cache(maxsize=1)
+def _get_model() -> Any:
+    """Configure Gemini and build the extraction model once per process."""
+    settings = get_settings()
+    genai.configure(api_key=settings.google_api_key)
+    return genai.GenerativeModel("gemini-2.0-flash")
+
+
+def _build_extraction_prompt(section: str, conversation_text: str) -> str:
+    """Build the extraction prompt for a single intake section."""
+    header = EXTRACTION_PROMPT.format(
+        section=section,
+        schema=SECTION_SCHEMAS[section],
+    )
+    return header + conversation_text
+
+
+def warm_up() -> None:
+    """Build the extraction model ahead of the first extraction."""
+    _get_model()
+
+
 def format_conversation(history: list[dict]) -> str:
     """Format conversation history for the prompt."""
     lines = []
@@ -90,97 +123,172 @@ async def extract_intake_data(
         return _create_empty_intake(session_id)
 
     try:
-        import google.generativeai as genai
-
-        settings = get_settings()
-        genai.configure(api_key=settings.google_api_key)
-
-        model = genai.GenerativeModel("gemini-2.0-flash")
-
-        # Build extraction prompt
+        model = _get_model()
         conversation_text = format_conversation(conversation_history)
-        prompt = EXTRACTION_PROMPT + conversation_text
-
-        # Call Gemini
-        response = await model.generate_content_async(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=0.1,
-                max_output_tokens=2000,
-            ),
+        generation_config = genai.GenerationConfig(
+            temperature=0.1,
+            max_output_tokens=2000,
+            response_mime_type="application/json",
         )
 
-        # Parse response
-        result_text = response.text.strip()
-
-        # Remove markdown code blocks if present
-        if result_text.startswith("```"):
-            lines = result_text.split("\n")
-            result_text = "\n".join(lines[1:-1])
-
-        data = json.loads(result_text)
+        # One call per section, run concurrently
+        sections = list(SECTION_SCHEMAS)
+        responses = await asyncio.gather(
+            *(
+                model.generate_content_async(
+                    _build_extraction_prompt(section, conversation_text),
+                    generation_config=generation_config,
+                )
+                for section in sections
+            ),
+            return_exceptions=True,
+        )
+    except Exception as e:
+        logger.error(f"Extraction failed: {e}")
+        return _create_empty_intake(session_id, error=str(e))
 
-        return _parse_extraction_result(data, session_id, len(conversation_history))
+    data: dict[str, Any] = {}
+    failed: set[str] = set()
+    for section, response in zip(sections, responses):
+        if isinstance(response, BaseException):
+            logger.error(f"Extraction failed for {section}: {response}")
+            failed.add(section)
+            continue
+        try:
+            # JSON mode returns a bare object, no markdown fences
+            data[section] = json.loads(response.text).get(section)
+        except (json.JSONDecodeError, AttributeError, ValueError) as e:
+            logger.error(f"Failed to parse extraction JSON for {section}: {e}")
+            failed.add(section)
 
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse extraction JSON: {e}")
-        return _create_empty_intake(session_id, error=str(e))
+    try:
+        return _parse_extraction_result(
+            data, session_id, len(conversation_history), failed
+        )
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
         return _create_empty_intake(session_id, error=str(e))
 
 
-def _parse_extraction_result(
-    data: dict,
-    session_id: str,
-    message_count: int,
-) -> IntakeData:
-    """Parse LLM extraction result into IntakeData."""
-    demographics_data = data.get("demographics", {})
-    visit_data = data.get("visit", {})
-    history_data = data.get("medical_history", {})
-    medications_data = data.get("medications", [])
-    allergies_data = data.get("allergies", {})
-
-    # Build demographics
-    demographics = Demographics(
-        full_name=demographics_data.get("full_name"),
-        date_of_birth=demographics_data.get("date_of_birth"),
-        phone=demographics_data.get("phone"),
-        email=demographics_data.get("email"),
+def _merge_unique(
+    items: Any,
+    key: Callable[[Any], Any] = str.lower,
+) -> Any:
+    """
+    Drop repeated entries, comparing by key and keeping first occurrence.
+
+    Only lists are deduplicated. None becomes an empty list, a bare string
+    is wrapped as a single entry, and anything else is returned unchanged
+    for the model to validate.
+    """
+    if items is None:
+        return []
+    if isinstance(items, str):
+        return [items]
+    if not isinstance(items, list):
+        return items
+    seen: set[Any] = set()
+    unique = []
+    for item in items:
+        item_key = key(item)
+        if item_key not in seen:
+            seen.add(item_key)
+            unique.append(item)
+    return unique
+
+
+def _build_demographics(data: Any) -> Demographics:
+    """Build the demographics section."""
+    data = data or {}
+    return Demographics(
+        full_name=data.get("full_name"),
+        date_of_birth=data.get("date_of_birth"),
+        phone=data.get("phone"),
+        email=data.get("email"),
     )
 
-    # Build visit
-    visit = Visit(
-        chief_complaint=visit_data.get("chief_complaint"),
-        symptoms=visit_data.get("symptoms", []),
-        duration=visit_data.get("duration"),
-        severity=visit_data.get("severity"),
+
+def _build_visit(data: Any) -> Visit:
+    """Build the visit section."""
+    data = data or {}
+    return Visit(
+        chief_complaint=data.get("chief_complaint"),
+        symptoms=_merge_unique(data.get("symptoms")),
+        duration=data.get("duration"),
+        severity=data.get("severity"),
     )
 
-    # Build medical history
-    medical_history = MedicalHistory(
-        chronic_conditions=history_data.get("chronic_conditions", []),
-        surgeries=history_data.get("surgeries", []),
-        hospitalizations=history_data.get("hospitalizations", []),
+
+def _build_medical_history(data: Any) -> MedicalHistory:
+    """Build the medical history section."""
+    data = data or {}
+    return MedicalHistory(
+        chronic_conditions=_merge_unique(data.get("chronic_conditions")),
+        surgeries=_merge_unique(data.get("surgeries")),
+        hospitalizations=_merge_unique(data.get("hospitalizations")),
     )
 
-    # Build medications
-    medications = []
-    for med in medications_data:
-        if isinstance(med, dict) and med.get("name"):
-            medications.append(Medication(
-                name=med["name"],
-                dosage=med.get("dosage"),
-            ))
-
-    # Build allergies
-    allergies = Allergies(
-        drug_allergies=allergies_data.get("drug_allergies", []),
-        food_allergies=allergies_data.get("food_allergies", []),
-        reactions=allergies_data.get("reactions"),
+
+def _build_medications(data: Any) -> list[Medication]:
+    """Build the medications section, one entry per name and dosage."""
+    named = [m for m in data or () if isinstance(m, dict) and m.get("name")]
+    return [
+        Medication(name=med["name"], dosage=med.get("dosage"))
+        for med in _merge_unique(
+            named, key=lambda m: (m["name"].lower(), m.get("dosage"))
+        )
+    ]
+
+
+def _build_allergies(data: Any) -> Allergies:
+    """Build the allergies section."""
+    data = data or {}
+    return Allergies(
+        drug_allergies=_merge_unique(data.get("drug_allergies")),
+        food_allergies=_merge_unique(data.get("food_allergies")),
+        reactions=data.get("reactions"),
     )
 
+
+# Builder and empty fallback for each section, in SECTION_SCHEMAS order
+_SECTION_BUILDERS: dict[str, tuple[Callable[[Any], Any], Callable[[], Any]]] = {
+    "demographics": (_build_demographics, Demographics),
+    "visit": (_build_visit, Visit),
+    "medical_history": (_build_medical_history, MedicalHistory),
+    "medications": (_build_medications, list),
+    "allergies": (_build_allergies, Allergies),
+}
+
+
+def _parse_extraction_result(
+    data: dict,
+    session_id: str,
+    message_count: int,
+    failed: set[str] | None = None,
+) -> IntakeData:
+    """
+    Parse LLM extraction result into IntakeData.
+
+    Each section is validated on its own; a section that failed to extract
+    or holds an invalid value falls back to its empty model and is listed
+    in metadata.failed_sections, leaving the record incomplete.
+    """
+    failed = set(failed or ())
+    built: dict[str, Any] = {}
+    for section, (build, empty) in _SECTION_BUILDERS.items():
+        try:
+            built[section] = build(data.get(section))
+        except (ValidationError, AttributeError, KeyError, TypeError) as e:
+            logger.error(f"Invalid extraction for {section}: {e}")
+            failed.add(section)
+            built[section] = empty()
+
+    demographics = built["demographics"]
+    visit = built["visit"]
+    medical_history = built["medical_history"]
+    medications = built["medications"]
+    allergies = built["allergies"]
+
     # Count completed sections
     sections_completed = sum([
         bool(demographics.full_name or demographics.date_of_birth),
@@ -192,8 +300,7 @@ def _parse_extraction_result(
 
     return IntakeData(
         session_id=session_id,
-        timestamp=datetime.utcnow(),
-        status="complete",
+        status="incomplete" if failed else "complete",
         demographics=demographics,
         visit=visit,
         medical_history=medical_history,
@@ -201,6 +308,7 @@ def _parse_extraction_result(
         allergies=allergies,
         metadata=IntakeMetadata(
             sections_completed=sections_completed,
+            failed_sections=[s for s in _SECTION_BUILDERS if s in failed],
         ),
     )
 
@@ -209,7 +317,6 @@ def _create_empty_intake(session_id: str, error: str | None = None) -> IntakeDat
     """Create an empty intake record."""
     return IntakeData(
         session_id=session_id,
-        timestamp=datetime.utcnow(),
         status="incomplete" if error else "in_progress",
         demographics=Demographics(),
         visit=Visit(),
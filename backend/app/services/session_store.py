@@ -6,26 +6,118 @@ No database required - sessions are ephemeral.
 """
 
 import asyncio
+import secrets
+import sys
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
 from typing import Any
-from uuid import uuid4
 
-from backend.app.models.messages import SessionState, SessionStatus, IntakeState
+from backend.app.models.messages import (
+    ConversationTurn,
+    IntakeState,
+    SessionState,
+    SessionStatus,
+    utc_now,
+)
+
+# Maximum conversation turns retained per in-memory session
+MAX_TURNS = 200
+
+# Number of lock stripes; must be a power of two
+LOCK_STRIPES = 32
+
+# Most sessions kept in memory; the least recently used is dropped first
+MAX_SESSIONS = 10_000
+
+# Sessions untouched for this long are dropped by evict_expired()
+SESSION_TTL_SECONDS = 3600
+
+
+class _Session:
+    """
+    Internal session record.
+
+    Slotted plain object for the hot in-memory path; converted to a
+    SessionState model only at the API boundary.
+    """
+
+    __slots__ = (
+        "session_id",
+        "status",
+        "current_state",
+        "turns",
+        "created_at",
+        "updated_at",
+        "room_url",
+        "token",
+        "last_seen",
+    )
+
+    def __init__(
+        self,
+        session_id: str,
+        room_url: str,
+        token: str | None,
+        now: datetime,
+    ) -> None:
+        self.session_id = session_id
+        self.status = SessionStatus.ACTIVE
+        self.current_state = IntakeState.GREETING
+        self.turns: deque[ConversationTurn] = deque(maxlen=MAX_TURNS)
+        self.created_at = now
+        self.updated_at = now
+        self.room_url = room_url
+        self.token = token
+        self.last_seen = time.monotonic()
+
+    def to_state(self) -> SessionState:
+        """Build the public SessionState model for this record."""
+        return SessionState(
+            session_id=self.session_id,
+            status=self.status,
+            current_state=self.current_state,
+            turns=list(self.turns),
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
 
 
 class SessionStore:
     """
     In-memory session storage with thread-safe operations.
 
-    Stores sessions as Dict[session_id, SessionState].
+    Stores sessions as an LRU-ordered Dict[session_id, _Session], bounded
+    by MAX_SESSIONS and expired after SESSION_TTL_SECONDS of inactivity.
     Sessions are ephemeral and lost on restart.
     """
 
+    # Fields callers may change through update(); the id and timestamps
+    # are managed by the store itself
+    _UPDATABLE = frozenset(SessionState.model_fields) - {
+        "session_id",
+        "created_at",
+        "updated_at",
+    }
+
     def __init__(self) -> None:
-        self._sessions: dict[str, SessionState] = {}
-        self._room_urls: dict[str, str] = {}  # session_id -> room_url
-        self._tokens: dict[str, str] = {}  # session_id -> token
-        self._lock = asyncio.Lock()
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        # Ids of sessions whose status is ACTIVE, for list_active()
+        self._active: set[str] = set()
+        # Writers to different sessions don't contend; reads take no lock
+        self._locks = tuple(asyncio.Lock() for _ in range(LOCK_STRIPES))
+
+    def _lock_for(self, session_id: str) -> asyncio.Lock:
+        """Get the lock stripe guarding a session."""
+        return self._locks[hash(session_id) & (LOCK_STRIPES - 1)]
+
+    def _touch(self, session_id: str) -> _Session | None:
+        """Look up a session and mark it most recently used."""
+        session = self._sessions.get(session_id)
+        if session:
+            session.last_seen = time.monotonic()
+            self._sessions.move_to_end(session_id)
+        return session
 
     async def create(self, room_url: str, token: str | None = None) -> SessionState:
         """
@@ -38,21 +130,21 @@ class SessionStore:
         Returns:
             Created SessionState.
         """
-        async with self._lock:
-            session_id = str(uuid4())
-            session = SessionState(
-                session_id=session_id,
-                status=SessionStatus.ACTIVE,
-                current_state=IntakeState.GREETING,
-                turns=[],
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
+        # Interned so the key, the record and every returned SessionState
+        # share one string object with its hash already cached
+        session_id = sys.intern(secrets.token_urlsafe(16))
+        session = _Session(
+            session_id=session_id,
+            room_url=room_url,
+            token=token or None,
+            now=utc_now(),
+        )
+        async with self._lock_for(session_id):
             self._sessions[session_id] = session
-            self._room_urls[session_id] = room_url
-            if token:
-                self._tokens[session_id] = token
-            return session
+            self._active.add(session_id)
+        while len(self._sessions) > MAX_SESSIONS:
+            self._active.discard(self._sessions.popitem(last=False)[0])
+        return session.to_state()
 
     async def get(self, session_id: str) -> SessionState | None:
         """
@@ -64,15 +156,18 @@ class SessionStore:
         Returns:
             SessionState if found, None otherwise.
         """
-        return self._sessions.get(session_id)
+        session = self._touch(session_id)
+        return session.to_state() if session else None
 
     async def get_room_url(self, session_id: str) -> str | None:
         """Get Daily room URL for session."""
-        return self._room_urls.get(session_id)
+        session = self._touch(session_id)
+        return session.room_url if session else None
 
     async def get_token(self, session_id: str) -> str | None:
         """Get meeting token for session."""
-        return self._tokens.get(session_id)
+        session = self._touch(session_id)
+        return session.token if session else None
 
     async def update(self, session_id: str, **kwargs: Any) -> SessionState | None:
         """
@@ -85,21 +180,46 @@ class SessionStore:
         Returns:
             Updated SessionState if found, None otherwise.
         """
-        async with self._lock:
-            session = self._sessions.get(session_id)
+        async with self._lock_for(session_id):
+            session = self._touch(session_id)
             if not session:
                 return None
 
-            # Update allowed fields
-            update_data = session.model_dump()
-            for key, value in kwargs.items():
-                if key in update_data:
-                    update_data[key] = value
-            update_data["updated_at"] = datetime.utcnow()
+            # Validate everything before touching the record, so a bad value
+            # raises without leaving the session half-updated
+            updates = self._coerce(kwargs)
 
-            updated_session = SessionState(**update_data)
-            self._sessions[session_id] = updated_session
-            return updated_session
+            # Update allowed fields in place, stamping only real changes
+            changed = False
+            for key, value in updates.items():
+                if key == "turns":
+                    session.turns = deque(value, maxlen=MAX_TURNS)
+                    changed = True
+                elif getattr(session, key) != value:
+                    setattr(session, key, value)
+                    changed = True
+            if "status" in updates:
+                if session.status == SessionStatus.ACTIVE:
+                    self._active.add(session_id)
+                else:
+                    self._active.discard(session_id)
+            if changed:
+                session.updated_at = utc_now()
+
+            return session.to_state()
+
+    def _coerce(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Validate update values, dropping fields callers may not change."""
+        updates = {k: v for k, v in kwargs.items() if k in self._UPDATABLE}
+        if "status" in updates:
+            updates["status"] = SessionStatus(updates["status"])
+        if "current_state" in updates:
+            updates["current_state"] = IntakeState(updates["current_state"])
+        if "turns" in updates:
+            updates["turns"] = [
+                ConversationTurn.model_validate(turn) for turn in updates["turns"]
+            ]
+        return updates
 
     async def delete(self, session_id: str) -> bool:
         """
@@ -111,13 +231,9 @@ class SessionStore:
         Returns:
             True if deleted, False if not found.
         """
-        async with self._lock:
-            if session_id in self._sessions:
-                del self._sessions[session_id]
-                self._room_urls.pop(session_id, None)
-                self._tokens.pop(session_id, None)
-                return True
-            return False
+        async with self._lock_for(session_id):
+            self._active.discard(session_id)
+            return self._sessions.pop(session_id, None) is not None
 
     async def cleanup_all(self) -> int:
         """
@@ -126,19 +242,35 @@ class SessionStore:
         Returns:
             Number of sessions deleted.
         """
-        async with self._lock:
-            count = len(self._sessions)
-            self._sessions.clear()
-            self._room_urls.clear()
-            self._tokens.clear()
-            return count
+        # Synchronous clear: no await, so no writer can interleave
+        count = len(self._sessions)
+        self._sessions.clear()
+        self._active.clear()
+        return count
+
+    def evict_expired(self) -> int:
+        """
+        Drop sessions idle for longer than SESSION_TTL_SECONDS.
+
+        Sessions are kept in least-recently-used order, so the scan stops
+        at the first one still within its TTL.
+
+        Returns:
+            Number of sessions evicted.
+        """
+        cutoff = time.monotonic() - SESSION_TTL_SECONDS
+        evicted = 0
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if session.last_seen > cutoff:
+                break
+            self._active.discard(self._sessions.popitem(last=False)[0])
+            evicted += 1
+        return evicted
 
     async def list_active(self) -> list[SessionState]:
         """List all active sessions."""
-        return [
-            s for s in self._sessions.values()
-            if s.status == SessionStatus.ACTIVE
-        ]
+        return [self._sessions[sid].to_state() for sid in list(self._active)]
 
     def __len__(self) -> int:
         """Return number of sessions."""
@@ -3,16 +3,41 @@ MedVoice Voice Pipeline
 
 Pipecat-based voice processing for real-time audio conversations.
 
-Note: Heavy imports (pipecat, etc.) are lazy-loaded to avoid import errors
-when dependencies aren't installed. Use direct imports for specific modules.
+Note: Heavy imports (pipecat, etc.) are lazy-loaded on first attribute
+access (PEP 562), so importing this package never pulls in pipecat.
 """
 
-# Only import room.py here as it has minimal dependencies
-from backend.app.voice.room import create_daily_room
+from importlib import import_module
+from typing import Any
 
-__all__ = [
-    "create_daily_room",
-]
+# Public name -> defining submodule, resolved on first access
+_LAZY_EXPORTS = {
+    "create_context": "backend.app.voice.context",
+    "create_daily_room": "backend.app.voice.room",
+    "create_llm_service": "backend.app.voice.llm",
+    "create_stt_service": "backend.app.voice.stt",
+    "create_transport": "backend.app.voice.transport",
+    "create_tts_service": "backend.app.voice.tts",
+    "create_vad_analyzer": "backend.app.voice.vad",
+    "run_voice_bot": "backend.app.voice.pipeline_flow",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public component on first access and cache it."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List lazy components alongside the module's own names."""
+    return sorted(set(globals()) | set(__all__))
 
 
 def get_voice_components():
@@ -22,20 +47,4 @@ def get_voice_components():
     Returns dict with all voice component factories.
     Only call this when pipecat is installed.
     """
-    from backend.app.voice.context import create_context
-    from backend.app.voice.llm import create_llm_service
-    from backend.app.voice.pipeline_flow import run_voice_bot
-    from backend.app.voice.stt import create_stt_service
-    from backend.app.voice.transport import create_transport
-    from backend.app.voice.tts import create_tts_service
-    from backend.app.voice.vad import create_vad_analyzer
-
-    return {
-        "create_context": create_context,
-        "create_llm_service": create_llm_service,
-        "create_stt_service": create_stt_service,
-        "create_transport": create_transport,
-        "create_tts_service": create_tts_service,
-        "create_vad_analyzer": create_vad_analyzer,
-        "run_voice_bot": run_voice_bot,
-    }
+    return {name: __getattr__(name) for name in __all__ if name != "create_daily_room"}
@@ -5,6 +5,7 @@ Provides LLM service and prompt management for voice pipeline.
 """
 
 from backend.app.voice.llm.prompts import (
+    GREETING_PROMPT,
     MEDICAL_INTAKE_PROMPT,
     get_greeting_message,
     get_system_message,
@@ -12,6 +13,7 @@ from backend.app.voice.llm.prompts import (
 from backend.app.voice.llm.service import create_llm_service
 
 __all__ = [
+    "GREETING_PROMPT",
     "MEDICAL_INTAKE_PROMPT",
     "create_llm_service",
     "get_greeting_message",
@@ -9,6 +9,8 @@ Your job is to collect basic patient information for a doctor's visit.
 Keep responses brief (1-2 sentences) since this is a voice conversation.
 Be warm, professional, and patient."""
 
+GREETING_PROMPT = "Greet the patient warmly and ask how you can help them today."
+
 
 def get_system_message(prompt: str = MEDICAL_INTAKE_PROMPT) -> dict[str, str]:
     """Create a system message dict for LLM context."""
@@ -17,7 +19,4 @@ def get_system_message(prompt: str = MEDICAL_INTAKE_PROMPT) -> dict[str, str]:
 
 def get_greeting_message() -> dict[str, str]:
     """Create a greeting trigger message."""
-    return {
-        "role": "system",
-        "content": "Greet the patient warmly and ask how you can help them today.",
-    }
+    return {"role": "system", "content": GREETING_PROMPT}
@@ -6,20 +6,24 @@ Creates Google Gemini LLM service for voice pipeline.
 
 from pipecat.services.google.llm import GoogleLLMService
 
-from backend.app.config import get_settings
+from backend.app.config import Settings, get_settings
 
 
-def create_llm_service(model: str = "gemini-2.0-flash") -> GoogleLLMService:
+def create_llm_service(
+    model: str = "gemini-2.0-flash",
+    settings: Settings | None = None,
+) -> GoogleLLMService:
     """
     Create a Google Gemini LLM service.
 
     Args:
         model: Gemini model name to use.
+        settings: Settings to read the API key from; defaults to get_settings().
 
     Returns:
         Configured GoogleLLMService instance.
     """
-    settings = get_settings()
+    settings = settings or get_settings()
     return GoogleLLMService(
         api_key=settings.google_api_key,
         model=model,
@@ -6,6 +6,7 @@ Run: python -m backend.app.voice.pipeline_flow
 """
 
 import asyncio
+import sys
 
 from loguru import logger
 from pipecat.frames.frames import EndFrame, LLMMessagesFrame
@@ -15,6 +16,7 @@ from pipecat.pipeline.task import PipelineParams, PipelineTask
 from pipecat.services.google.llm import GoogleLLMService
 from pipecat.transports.daily.transport import DailyTransport
 
+from backend.app.config import get_settings
 from backend.app.voice.context import create_context
 from backend.app.voice.llm import (
     create_llm_service,
@@ -108,9 +110,10 @@ async def run_voice_bot() -> None:
 
     # Create services
     transport = create_transport(room_url)
-    stt = create_stt_service()
-    tts = create_tts_service()
-    llm = create_llm_service()
+    settings = get_settings()
+    stt = create_stt_service(settings=settings)
+    tts = create_tts_service(settings=settings)
+    llm = create_llm_service(settings=settings)
 
     # Create context with system prompt
     context = create_context([get_system_message()])
@@ -134,4 +137,9 @@ async def run_voice_bot() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(run_voice_bot())
+    if sys.platform != "win32":
+        import uvloop
+
+        uvloop.run(run_voice_bot())
+    else:
+        asyncio.run(run_voice_bot())
@@ -4,12 +4,53 @@ Daily Room Management
 Creates temporary Daily.co rooms for WebRTC sessions.
 """
 
+import json
 import time
+from functools import lru_cache
 
 import aiohttp
+from aiohttp import hdrs
 
 from backend.app.config import get_settings
 
+# Shared HTTP session, reused across room creations to keep the
+# connection to api.daily.co warm. Closed on application shutdown.
+_session: aiohttp.ClientSession | None = None
+
+
+DAILY_ROOMS_URL = "https://api.daily.co/v1/rooms"
+
+
+@lru_cache(maxsize=1)
+def _daily_headers(api_key: str) -> dict[str, str]:
+    """Build the Daily API request headers once per API key."""
+    return {
+        hdrs.AUTHORIZATION: f"Bearer {api_key}",
+        hdrs.CONTENT_TYPE: "application/json",
+    }
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Get the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            ),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session if it is open."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
 
 async def create_daily_room(expiry_seconds: int = 3600) -> str:
     """
@@ -29,17 +70,18 @@ async def create_daily_room(expiry_seconds: int = 3600) -> str:
     if not settings.daily_api_key:
         raise ValueError("DAILY_API_KEY not set")
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            "https://api.daily.co/v1/rooms",
-            headers={
-                "Authorization": f"Bearer {settings.daily_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={"properties": {"exp": int(time.time()) + expiry_seconds}},
-        ) as response:
-            if response.status != 200:
-                error = await response.text()
-                raise RuntimeError(f"Failed to create room: {error}")
-            room = await response.json()
-            return room["url"]
+    session = await _get_session()
+    body = json.dumps(
+        {"properties": {"exp": int(time.time()) + expiry_seconds}},
+        separators=(",", ":"),
+    )
+    async with session.post(
+        DAILY_ROOMS_URL,
+        headers=_daily_headers(settings.daily_api_key),
+        data=body,
+    ) as response:
+        if response.status != 200:
+            error = await response.text()
+            raise RuntimeError(f"Failed to create room: {error}")
+        room = await response.json()
+        return room["url"]
@@ -14,6 +14,7 @@ from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
 
+from backend.app.config import get_settings
 from backend.app.voice.context import create_context
 from backend.app.voice.llm import (
     create_llm_service,
@@ -48,9 +49,10 @@ async def run_pipeline_for_room(
     try:
         # Create services
         transport = create_transport(room_url, bot_name="MedVoice Bot")
-        stt = create_stt_service()
-        tts = create_tts_service()
-        llm = create_llm_service()
+        settings = get_settings()
+        stt = create_stt_service(settings=settings)
+        tts = create_tts_service(settings=settings)
+        llm = create_llm_service(settings=settings)
 
         # Create context with system prompt
         context = create_context([get_system_message()])
@@ -4,14 +4,21 @@ Speech-to-Text Service Factory
 Creates Deepgram STT service for voice pipeline.
 """
 
-from pipecat.services.deepgram.stt import DeepgramSTTService
+from pipecat.services.deepgram.stt import DeepgramSTTService, LiveOptions
 
-from backend.app.config import get_settings
+from backend.app.config import Settings, get_settings
+
+# Silence (ms) after which Deepgram finalizes an utterance. Deepgram's own
+# default is 10 ms, which cuts patients off at brief pauses mid-sentence;
+# 200 ms waits out those pauses while still finalizing well before the
+# transport's Silero VAD declares the turn over.
+ENDPOINTING_MS = 200
 
 
 def create_stt_service(
     model: str = "nova-2-general",
     language: str = "en-US",
+    settings: Settings | None = None,
 ) -> DeepgramSTTService:
     """
     Create a Deepgram STT service.
@@ -19,13 +26,25 @@ def create_stt_service(
     Args:
         model: Deepgram model name.
         language: Language code for recognition.
+        settings: Settings to read the API key from; defaults to get_settings().
 
     Returns:
         Configured DeepgramSTTService instance.
     """
-    settings = get_settings()
+    settings = settings or get_settings()
     return DeepgramSTTService(
         api_key=settings.deepgram_api_key,
         model=model,
         language=language,
+        live_options=LiveOptions(
+            model=model,
+            language=language,
+            endpointing=ENDPOINTING_MS,
+            interim_results=True,
+            smart_format=True,
+            # Don't hold transcripts back while smart_format groups numbers
+            no_delay=True,
+            # vad_events stays off: the transport's Silero VAD already drives
+            # speech start/stop, and Deepgram's events would duplicate them
+        ),
     )
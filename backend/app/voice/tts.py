@@ -6,20 +6,24 @@ Creates Deepgram TTS service for voice pipeline.
 
 from pipecat.services.deepgram.tts import DeepgramTTSService
 
-from backend.app.config import get_settings
+from backend.app.config import Settings, get_settings
 
 
-def create_tts_service(voice: str = "aura-asteria-en") -> DeepgramTTSService:
+def create_tts_service(
+    voice: str = "aura-asteria-en",
+    settings: Settings | None = None,
+) -> DeepgramTTSService:
     """
     Create a Deepgram TTS service.
 
     Args:
         voice: Voice identifier for synthesis.
+        settings: Settings to read the API key from; defaults to get_settings().
 
     Returns:
         Configured DeepgramTTSService instance.
     """
-    settings = get_settings()
+    settings = settings or get_settings()
     return DeepgramTTSService(
         api_key=settings.deepgram_api_key,
         voice=voice,
@@ -4,165 +4,343 @@ Shared test fixtures and configuration for all tests.
 Provides mocked external services and test utilities.
 """
 
+import importlib.util
+import json
 import sys
 import pytest
-from unittest.mock import MagicMock, AsyncMock, patch
-
-# Mock pipecat module and all its submodules before any imports
-sys.modules["pipecat"] = MagicMock()
-sys.modules["pipecat.services"] = MagicMock()
-sys.modules["pipecat.services.google"] = MagicMock()
-sys.modules["pipecat.services.google.llm"] = MagicMock()
-sys.modules["pipecat.services.deepgram"] = MagicMock()
-sys.modules["pipecat.services.deepgram.stt"] = MagicMock()
-sys.modules["pipecat.services.deepgram.tts"] = MagicMock()
-sys.modules["pipecat.audio"] = MagicMock()
-sys.modules["pipecat.audio.vad"] = MagicMock()
-sys.modules["pipecat.audio.vad.silero"] = MagicMock()
-sys.modules["pipecat.audio.vad.vad_analyzer"] = MagicMock()
-sys.modules["pipecat.processors"] = MagicMock()
-sys.modules["pipecat.processors.aggregators"] = MagicMock()
-sys.modules["pipecat.processors.aggregators.openai_llm_context"] = MagicMock()
-sys.modules["pipecat.transports"] = MagicMock()
-sys.modules["pipecat.transports.daily"] = MagicMock()
-sys.modules["pipecat.transports.daily.transport"] = MagicMock()
-sys.modules["pipecat.frames"] = MagicMock()
-sys.modules["pipecat.frames.frames"] = MagicMock()
-sys.modules["pipecat.pipeline"] = MagicMock()
-sys.modules["pipecat.pipeline.pipeline"] = MagicMock()
-sys.modules["pipecat.pipeline.runner"] = MagicMock()
-sys.modules["pipecat.pipeline.task"] = MagicMock()
-
-# Mock aiohttp for async tests
-sys.modules["aiohttp"] = MagicMock()
+from unittest.mock import AsyncMock, MagicMock
+
+# Third-party modules replaced with mocks when their package isn't installed
+_MOCKED_MODULES = (
+    "pipecat",
+    "pipecat.services",
+    "pipecat.services.google",
+    "pipecat.services.google.llm",
+    "pipecat.services.deepgram",
+    "pipecat.services.deepgram.stt",
+    "pipecat.services.deepgram.tts",
+    "pipecat.audio",
+    "pipecat.audio.vad",
+    "pipecat.audio.vad.silero",
+    "pipecat.audio.vad.vad_analyzer",
+    "pipecat.processors",
+    "pipecat.processors.aggregators",
+    "pipecat.processors.aggregators.openai_llm_context",
+    "pipecat.transports",
+    "pipecat.transports.daily",
+    "pipecat.transports.daily.transport",
+    "pipecat.frames",
+    "pipecat.frames.frames",
+    "pipecat.pipeline",
+    "pipecat.pipeline.pipeline",
+    "pipecat.pipeline.runner",
+    "pipecat.pipeline.task",
+    "aiohttp",
+    "google",
+    "google.generativeai",
+)
+
+
+def pytest_configure(config):
+    """Install module mocks once per process, before any test imports."""
+    roots = {name.partition(".")[0] for name in _MOCKED_MODULES}
+    missing = {root for root in roots if importlib.util.find_spec(root) is None}
+    for name in _MOCKED_MODULES:
+        if name.partition(".")[0] in missing:
+            sys.modules.setdefault(name, MagicMock())
+
+
+def _patched(target, mock):
+    """Keep target patched with mock until the end of the session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(target, mock)
+        yield mock
+
+
+def _patched_class(target, **attrs):
+    """
+    Patch the class at target for the session with a mock class.
+
+    Instances are specced on the real class when pipecat is installed,
+    so tests can't pass against attributes the real API doesn't have.
+    """
+    module_name, _, name = target.rpartition(".")
+    original = getattr(importlib.import_module(module_name), name)
+    spec = original if isinstance(original, type) else None
+    instance = MagicMock(spec=spec)
+    instance.configure_mock(**attrs)
+    yield from _patched(target, MagicMock(spec=spec, return_value=instance))
+
+
+# Service class mocks are patched once per session; the public fixtures
+# below hand them out with call history cleared for each test.
+
+
+@pytest.fixture(scope="session")
+def _google_llm_service():
+    yield from _patched_class(
+        "backend.app.voice.llm.service.GoogleLLMService",
+        api_key="test-key",
+        model="gemini-2.0-flash",
+    )
+
+
+@pytest.fixture(scope="session")
+def _deepgram_stt_service():
+    yield from _patched_class(
+        "backend.app.voice.stt.DeepgramSTTService",
+        api_key="test-key",
+        model="nova-2-general",
+        language="en-US",
+    )
+
+
+@pytest.fixture(scope="session")
+def _deepgram_tts_service():
+    yield from _patched_class(
+        "backend.app.voice.tts.DeepgramTTSService",
+        api_key="test-key",
+        voice="aura-asteria-en",
+    )
+
+
+@pytest.fixture(scope="session")
+def _silero_vad_analyzer():
+    yield from _patched_class(
+        "backend.app.voice.vad.SileroVADAnalyzer",
+        params=MagicMock(stop_secs=0.3),
+    )
+
+
+@pytest.fixture(scope="session")
+def _vad_params():
+    yield from _patched_class(
+        "backend.app.voice.vad.VADParams",
+        stop_secs=0.3,
+    )
+
+
+@pytest.fixture(scope="session")
+def _daily_transport():
+    yield from _patched_class(
+        "backend.app.voice.transport.DailyTransport",
+        room_url="https://example.daily.co/test-room",
+        bot_name="MedVoice",
+        input=MagicMock(),
+        output=MagicMock(),
+        event_handler=MagicMock(),
+    )
+
+
+@pytest.fixture(scope="session")
+def _daily_params():
+    yield from _patched_class(
+        "backend.app.voice.transport.DailyParams",
+        audio_in_enabled=True,
+        audio_out_enabled=True,
+        vad_enabled=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def _openai_llm_context():
+    yield from _patched_class(
+        "backend.app.voice.context.OpenAILLMContext",
+        messages=[],
+    )
+
+
+@pytest.fixture(scope="session")
+def _create_vad_analyzer():
+    yield from _patched(
+        "backend.app.voice.transport.create_vad_analyzer", MagicMock()
+    )
+
+
+# Modules that bind get_settings by name at import time
+_SETTINGS_IMPORTERS = (
+    "backend.app.config",
+    "backend.app.voice.llm.service",
+    "backend.app.voice.room",
+    "backend.app.voice.stt",
+    "backend.app.voice.tts",
+)
+
+
+@pytest.fixture(scope="session")
+def _get_settings():
+    get_settings = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        for module in _SETTINGS_IMPORTERS:
+            mp.setattr(f"{module}.get_settings", get_settings)
+        yield get_settings
+
+
+@pytest.fixture(scope="session")
+def _settings_class():
+    yield from _patched("backend.app.config.Settings", MagicMock())
 
 
 @pytest.fixture
-def mock_settings():
+def mock_settings(_get_settings, _settings_class):
     """Mock application settings."""
-    with patch("backend.app.config.get_settings") as mock_get_settings:
-        with patch("backend.app.config.Settings") as mock_settings_class:
-            settings = MagicMock()
-            settings.deepgram_api_key = "test-deepgram-key"
-            settings.google_api_key = "test-google-key"
-            settings.daily_api_key = "test-daily-key"
-            mock_get_settings.return_value = settings
-            mock_settings_class.return_value = settings
-            yield settings
+    # Fresh settings per test; tests are free to mutate them
+    settings = MagicMock()
+    settings.deepgram_api_key = "test-deepgram-key"
+    settings.google_api_key = "test-google-key"
+    settings.daily_api_key = "test-daily-key"
+    _get_settings.reset_mock()
+    _get_settings.return_value = settings
+    _settings_class.reset_mock()
+    _settings_class.return_value = settings
+    return settings
 
 
 @pytest.fixture
-def mock_google_llm_service():
+def mock_google_llm_service(_google_llm_service):
     """Mock GoogleLLMService."""
-    with patch("backend.app.voice.llm.service.GoogleLLMService") as mock:
-        service = MagicMock()
-        service.api_key = "test-key"
-        service.model = "gemini-2.0-flash"
-        mock.return_value = service
-        yield mock
+    _google_llm_service.reset_mock()
+    return _google_llm_service
 
 
 @pytest.fixture
-def mock_deepgram_stt_service():
+def mock_deepgram_stt_service(_deepgram_stt_service):
     """Mock DeepgramSTTService."""
-    with patch("backend.app.voice.stt.DeepgramSTTService") as mock:
-        service = MagicMock()
-        service.api_key = "test-key"
-        service.model = "nova-2-general"
-        service.language = "en-US"
-        mock.return_value = service
-        yield mock
+    _deepgram_stt_service.reset_mock()
+    return _deepgram_stt_service
 
 
 @pytest.fixture
-def mock_deepgram_tts_service():
+def mock_deepgram_tts_service(_deepgram_tts_service):
     """Mock DeepgramTTSService."""
-    with patch("backend.app.voice.tts.DeepgramTTSService") as mock:
-        service = MagicMock()
-        service.api_key = "test-key"
-        service.voice = "aura-asteria-en"
-        mock.return_value = service
-        yield mock
+    _deepgram_tts_service.reset_mock()
+    return _deepgram_tts_service
 
 
 @pytest.fixture
-def mock_silero_vad_analyzer():
+def mock_silero_vad_analyzer(_silero_vad_analyzer):
     """Mock SileroVADAnalyzer."""
-    with patch("backend.app.voice.vad.SileroVADAnalyzer") as mock:
-        analyzer = MagicMock()
-        analyzer.params = MagicMock(stop_secs=0.3)
-        mock.return_value = analyzer
-        yield mock
+    _silero_vad_analyzer.reset_mock()
+    return _silero_vad_analyzer
 
 
 @pytest.fixture
-def mock_vad_params():
+def mock_vad_params(_vad_params):
     """Mock VADParams."""
-    with patch("backend.app.voice.vad.VADParams") as mock:
-        params = MagicMock()
-        params.stop_secs = 0.3
-        mock.return_value = params
-        yield mock
+    _vad_params.reset_mock()
+    return _vad_params
 
 
 @pytest.fixture
-def mock_daily_transport():
+def mock_daily_transport(_daily_transport):
     """Mock DailyTransport."""
-    with patch("backend.app.voice.transport.DailyTransport") as mock:
-        transport = MagicMock()
-        transport.room_url = "https://example.daily.co/test-room"
-        transport.bot_name = "MedVoice"
-        transport.input = MagicMock()
-        transport.output = MagicMock()
-        transport.event_handler = MagicMock()
-        mock.return_value = transport
-        yield mock
+    _daily_transport.reset_mock()
+    return _daily_transport
 
 
 @pytest.fixture
-def mock_daily_params():
+def mock_daily_params(_daily_params):
     """Mock DailyParams."""
-    with patch("backend.app.voice.transport.DailyParams") as mock:
-        params = MagicMock()
-        params.audio_in_enabled = True
-        params.audio_out_enabled = True
-        params.vad_enabled = True
-        mock.return_value = params
-        yield mock
+    _daily_params.reset_mock()
+    return _daily_params
 
 
 @pytest.fixture
-def mock_openai_llm_context():
+def mock_openai_llm_context(_openai_llm_context):
     """Mock OpenAILLMContext."""
-    with patch("backend.app.voice.context.OpenAILLMContext") as mock:
-        context = MagicMock()
-        context.messages = []
-        mock.return_value = context
-        yield mock
+    _openai_llm_context.reset_mock()
+    return _openai_llm_context
+
+
+@pytest.fixture
+def mock_create_vad_analyzer(_create_vad_analyzer):
+    """Mock the VAD analyzer factory used by create_transport."""
+    _create_vad_analyzer.reset_mock()
+    return _create_vad_analyzer
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    def __init__(self, status=200, payload=None, body="error"):
+        self.status = status
+        self.payload = payload
+        self.body = body
+
+    async def json(self):
+        return self.payload
+
+    async def text(self):
+        return self.body
+
+
+class FakeRequestContext:
+    """Async context manager returned by FakeClientSession.post."""
+
+    def __init__(self, response):
+        self.response = response
+
+    async def __aenter__(self):
+        return self.response
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class FakeClientSession:
+    """Minimal stand-in for aiohttp.ClientSession; post() records its calls."""
+
+    def __init__(self):
+        self.closed = False
+        self.response = FakeResponse(payload={"url": "https://test.daily.co/room"})
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return FakeRequestContext(self.response)
+
+    def last_post_json(self):
+        """Decode the JSON body of the most recent post."""
+        return json.loads(self.calls[-1][1]["data"])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def mock_aiohttp_session(monkeypatch):
+    """Fake aiohttp ClientSession for async tests."""
+    session = FakeClientSession()
+    # Hand the fake out in place of the room module's shared session
+    monkeypatch.setattr(
+        "backend.app.voice.room._get_session", AsyncMock(return_value=session)
+    )
+    return session
+
+
+@pytest.fixture
+def make_daily_response(mock_aiohttp_session):
+    """Configure the Daily API response returned by the fake session."""
+
+    def _make(status=200, body=None, text="error"):
+        response = mock_aiohttp_session.response
+        response.status = status
+        response.payload = body or {"url": "https://test.daily.co/room"}
+        response.body = text
+        return mock_aiohttp_session
+
+    return _make
 
 
 @pytest.fixture
-def mock_aiohttp_session():
-    """Mock aiohttp ClientSession for async tests."""
-    mock_response = AsyncMock()
-    mock_response.status = 200
-    mock_response.json = AsyncMock(return_value={"url": "https://test.daily.co/room"})
-    mock_response.text = AsyncMock(return_value="error")
-
-    mock_session = AsyncMock()
-    mock_session.post = AsyncMock()
-
-    # Setup the async context manager for post
-    mock_context = AsyncMock()
-    mock_context.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_context.__aexit__ = AsyncMock(return_value=None)
-    mock_session.post.return_value = mock_context
-
-    with patch("aiohttp.ClientSession") as mock_session_class:
-        # Setup the async context manager for the session
-        mock_session_context = AsyncMock()
-        mock_session_context.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session_context.__aexit__ = AsyncMock(return_value=None)
-        mock_session_class.return_value = mock_session_context
-
-        yield mock_session
+def fixed_time(monkeypatch):
+    """Freeze the clock seen by the room module and return the frozen time."""
+    now = 1000.0
+    monkeypatch.setattr("backend.app.voice.room.time.time", lambda: now)
+    return now
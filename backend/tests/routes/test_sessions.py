@@ -0,0 +1,126 @@
+"""
+Unit tests for routes.sessions module.
+
+Tests that session creation answers before the bot has started.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from backend.app.main import create_app
+from backend.app.models.messages import SessionStatus
+from backend.app.routes import sessions
+from backend.app.services.session_store import SessionStore
+
+ROOM_URL = "https://test.daily.co/room"
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Fresh session store seen by the routes."""
+    store = SessionStore()
+    monkeypatch.setattr(sessions, "session_store", store)
+    return store
+
+
+@pytest.fixture
+def start_bot(monkeypatch):
+    """Fake start_bot_for_session; the room is created instantly."""
+    monkeypatch.setattr(
+        sessions, "create_daily_room", AsyncMock(return_value=ROOM_URL)
+    )
+    mock = AsyncMock()
+    monkeypatch.setattr(sessions, "start_bot_for_session", mock)
+    return mock
+
+
+@pytest.fixture
+async def client():
+    """HTTP client bound to the app without running its lifespan."""
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def _drain_startup_tasks():
+    """Wait for every background bot startup to finish."""
+    await asyncio.gather(*sessions._startup_tasks.values())
+
+
+async def _never_start(session_id, room_url):
+    """Bot startup that never finishes on its own."""
+    await asyncio.Event().wait()
+
+
+class TestCreateSession:
+    """Test POST /api/sessions/."""
+
+    async def test_responds_before_bot_starts(self, client, store, start_bot):
+        """Test that the response doesn't wait for the bot to start."""
+        started = asyncio.Event()
+
+        async def _slow_start(session_id, room_url):
+            await started.wait()
+
+        start_bot.side_effect = _slow_start
+
+        response = await client.post("/api/sessions/")
+
+        assert response.status_code == 201
+        assert response.json()["room_url"] == ROOM_URL
+        assert list(sessions._startup_tasks) == [response.json()["session_id"]]
+
+        started.set()
+        await _drain_startup_tasks()
+
+        start_bot.assert_awaited_once_with(response.json()["session_id"], ROOM_URL)
+        assert not sessions._startup_tasks
+
+    async def test_failed_start_abandons_session(self, client, store, start_bot):
+        """Test that a bot startup failure marks the session abandoned."""
+        start_bot.side_effect = RuntimeError("pipeline failed")
+
+        response = await client.post("/api/sessions/")
+        await _drain_startup_tasks()
+
+        session = await store.get(response.json()["session_id"])
+        assert session.status == SessionStatus.ABANDONED
+
+
+class TestStartupCancellation:
+    """Test that pending bot startups don't outlive their session."""
+
+    async def test_delete_cancels_pending_startup(
+        self, client, store, start_bot, monkeypatch
+    ):
+        """Test that ending a session mid-startup cancels the startup."""
+        stop_bot = AsyncMock(return_value=False)
+        monkeypatch.setattr(sessions, "stop_bot_for_session", stop_bot)
+        start_bot.side_effect = _never_start
+
+        session_id = (await client.post("/api/sessions/")).json()["session_id"]
+        task = sessions._startup_tasks[session_id]
+        await asyncio.sleep(0)
+
+        response = await client.delete(f"/api/sessions/{session_id}")
+
+        assert response.status_code == 204
+        assert task.cancelled()
+        assert session_id not in sessions._startup_tasks
+        stop_bot.assert_awaited_once_with(session_id)
+
+    async def test_shutdown_cancels_all_pending_startups(
+        self, client, store, start_bot
+    ):
+        """Test that cancel_startup_tasks leaves no startup running."""
+        start_bot.side_effect = _never_start
+        for _ in range(2):
+            await client.post("/api/sessions/")
+        tasks = list(sessions._startup_tasks.values())
+
+        assert await sessions.cancel_startup_tasks() == 2
+        assert all(task.cancelled() for task in tasks)
+        assert not sessions._startup_tasks
@@ -0,0 +1,192 @@
+"""
+Unit tests for services.bot_runner module.
+
+Tests history caps and how intake extraction survives stop and cancel.
+"""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.app.models.messages import SessionStatus
+from backend.app.services import bot_runner
+from backend.app.services.bot_runner import (
+    MAX_HISTORY_CHARS,
+    MAX_HISTORY_MESSAGES,
+    BotRunner,
+)
+from backend.app.services.session_store import SessionStore
+
+ROOM_URL = "https://test.daily.co/room"
+
+HISTORY = [{"role": "user", "content": "I have a cough."}]
+
+
+def _message(content):
+    """Patient message with the given content."""
+    return {"role": "user", "content": content}
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Fresh session store seen by the bot runner."""
+    store = SessionStore()
+    monkeypatch.setattr(bot_runner, "session_store", store)
+    return store
+
+
+@pytest.fixture
+def release():
+    """Event that unblocks the fake pipeline and extraction."""
+    return asyncio.Event()
+
+
+@pytest.fixture
+def extract(monkeypatch, release):
+    """Fake extract_intake_data that waits for release."""
+
+    async def _extract(history):
+        await release.wait()
+
+    mock = AsyncMock(side_effect=_extract)
+    monkeypatch.setattr(
+        "backend.app.services.intake_extractor.extract_intake_data", mock
+    )
+    return mock
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Fake voice runner whose pipeline behaviour is set per test."""
+    fake = SimpleNamespace(run_pipeline_with_timeout=None)
+    monkeypatch.setitem(sys.modules, "backend.app.voice.runner", fake)
+    return fake
+
+
+async def _start(store, pipeline, run):
+    """Create a session and start a bot on the given fake pipeline."""
+    pipeline.run_pipeline_with_timeout = run
+    session = await store.create(room_url=ROOM_URL)
+    runner = BotRunner(session.session_id, ROOM_URL)
+    await runner.start()
+    await asyncio.sleep(0)
+    return runner
+
+
+async def _status(store, runner):
+    """Current status of the runner's session."""
+    return (await store.get(runner.session_id)).status
+
+
+class TestSetHistory:
+    """Test conversation retention caps."""
+
+    def test_keeps_most_recent_messages(self):
+        """Test that only the last MAX_HISTORY_MESSAGES are kept."""
+        runner = BotRunner("s1", ROOM_URL)
+        history = [_message(str(i)) for i in range(MAX_HISTORY_MESSAGES + 5)]
+
+        runner._set_history(history)
+
+        assert list(runner.conversation_history) == history[5:]
+
+    def test_drops_oldest_over_char_budget(self):
+        """Test that the oldest messages go once the char budget is exceeded."""
+        runner = BotRunner("s1", ROOM_URL)
+        big = "x" * (MAX_HISTORY_CHARS // 2)
+
+        runner._set_history([_message(big), _message(big), _message("tail")])
+
+        assert [m["content"] for m in runner.conversation_history] == [big, "tail"]
+
+    def test_none_content_counts_as_empty(self):
+        """Test that messages with content=None don't break the budget."""
+        runner = BotRunner("s1", ROOM_URL)
+
+        runner._set_history([{"role": "assistant", "content": None}, *HISTORY])
+
+        assert len(runner.conversation_history) == 2
+
+
+class TestExtraction:
+    """Test shielded and cancel-time intake extraction."""
+
+    async def test_completed_pipeline_extracts_once(
+        self, store, pipeline, extract, release
+    ):
+        """Test that a finished conversation is extracted and completed."""
+        release.set()
+        runner = await _start(store, pipeline, AsyncMock(return_value=HISTORY))
+
+        await runner.task
+
+        extract.assert_awaited_once_with(HISTORY)
+        assert await _status(store, runner) == SessionStatus.COMPLETE
+
+    async def test_stop_does_not_kill_shielded_extraction(
+        self, store, pipeline, extract, release
+    ):
+        """Test that stopping during extraction neither cancels nor repeats it."""
+        runner = await _start(store, pipeline, AsyncMock(return_value=HISTORY))
+        await asyncio.sleep(0)
+
+        await runner.stop()
+        assert not runner._extraction.done()
+
+        release.set()
+        await runner._extraction
+
+        extract.assert_awaited_once()
+        assert await _status(store, runner) == SessionStatus.COMPLETE
+
+    async def test_cancel_extracts_in_background(
+        self, store, pipeline, extract, release
+    ):
+        """Test that stop() returns without waiting on cancel-time extraction."""
+
+        async def _run(on_conversation_update, **kwargs):
+            on_conversation_update(HISTORY)
+            await asyncio.Event().wait()
+
+        runner = await _start(store, pipeline, _run)
+
+        await runner.stop()
+        assert not runner._extraction.done()
+        assert await _status(store, runner) == SessionStatus.ACTIVE
+
+        release.set()
+        await runner._extraction
+        assert await _status(store, runner) == SessionStatus.ABANDONED
+
+    async def test_cancel_without_history_abandons(self, store, pipeline, extract):
+        """Test that a bot stopped before any conversation is abandoned."""
+
+        async def _run(**kwargs):
+            await asyncio.Event().wait()
+
+        runner = await _start(store, pipeline, _run)
+
+        await runner.stop()
+
+        assert runner._extraction is None
+        extract.assert_not_called()
+        assert await _status(store, runner) == SessionStatus.ABANDONED
+
+    async def test_shutdown_waits_for_extraction(
+        self, store, pipeline, extract, release
+    ):
+        """Test that graceful_shutdown_all lets in-flight extraction finish."""
+
+        async def _run(on_conversation_update, **kwargs):
+            on_conversation_update(HISTORY)
+            await asyncio.Event().wait()
+
+        runner = await _start(store, pipeline, _run)
+        asyncio.get_running_loop().call_soon(release.set)
+
+        assert await bot_runner.graceful_shutdown_all() == 1
+        assert runner._extraction.done()
+        assert await _status(store, runner) == SessionStatus.ABANDONED
@@ -0,0 +1,163 @@
+"""
+Unit tests for services.intake_extractor module.
+
+Tests list deduplication, per-section extraction and per-section
+validation of the Gemini output.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.app.models.intake import Medication
+from backend.app.services.intake_extractor import (
+    SECTION_SCHEMAS,
+    _merge_unique,
+    _parse_extraction_result,
+    extract_intake_data,
+)
+
+SECTIONS = tuple(SECTION_SCHEMAS)
+
+HISTORY = [
+    {"role": "assistant", "content": "What brings you in today?"},
+    {"role": "user", "content": "I have had a cough for a week."},
+]
+
+# One valid Gemini payload per section
+SECTION_DATA = {
+    "demographics": {"full_name": "Jane Doe", "date_of_birth": "1980-01-01"},
+    "visit": {"chief_complaint": "cough", "symptoms": ["cough"], "severity": 4},
+    "medical_history": {"chronic_conditions": ["asthma"]},
+    "medications": [{"name": "Albuterol", "dosage": "90 mcg"}],
+    "allergies": {"drug_allergies": ["penicillin"]},
+}
+
+
+def _response(section, value):
+    """Gemini JSON-mode response holding one section."""
+    return SimpleNamespace(text=json.dumps({section: value}))
+
+
+@pytest.fixture
+def mock_model(monkeypatch):
+    """Patch the cached Gemini model; responses are set per test."""
+    model = MagicMock()
+    model.generate_content_async = AsyncMock()
+    monkeypatch.setattr(
+        "backend.app.services.intake_extractor._get_model", lambda: model
+    )
+    return model
+
+
+def _respond(model, **overrides):
+    """Answer each section call in order, with optional per-section results."""
+    model.generate_content_async.side_effect = [
+        overrides.get(section, _response(section, SECTION_DATA[section]))
+        for section in SECTIONS
+    ]
+
+
+class TestMergeUnique:
+    """Test _merge_unique list deduplication."""
+
+    def test_drops_case_insensitive_duplicates(self):
+        """Test that repeats are dropped keeping the first spelling."""
+        assert _merge_unique(["Cough", "fever", "cough"]) == ["Cough", "fever"]
+
+    def test_none_becomes_empty_list(self):
+        """Test that a missing value becomes an empty list."""
+        assert _merge_unique(None) == []
+
+    def test_bare_string_is_wrapped(self):
+        """Test that a bare string is kept whole, not split into characters."""
+        assert _merge_unique("cough") == ["cough"]
+
+    def test_non_list_returned_unchanged(self):
+        """Test that other values are left for the model to validate."""
+        value = {"symptom": "cough"}
+
+        assert _merge_unique(value) is value
+
+
+class TestParseExtractionResult:
+    """Test per-section validation of extraction results."""
+
+    def test_all_sections_valid_is_complete(self):
+        """Test that a fully valid payload yields a complete record."""
+        intake = _parse_extraction_result(SECTION_DATA, "s1", len(HISTORY))
+
+        assert intake.status == "complete"
+        assert intake.metadata.sections_completed == 5
+        assert intake.metadata.failed_sections == []
+
+    def test_invalid_section_falls_back_alone(self):
+        """Test that one invalid value empties only its own section."""
+        data = {**SECTION_DATA, "visit": {**SECTION_DATA["visit"], "severity": 11}}
+
+        intake = _parse_extraction_result(data, "s1", len(HISTORY))
+
+        assert intake.status == "incomplete"
+        assert intake.metadata.failed_sections == ["visit"]
+        assert intake.visit.chief_complaint is None
+        assert intake.demographics.full_name == "Jane Doe"
+        assert intake.allergies.drug_allergies == ["penicillin"]
+
+    def test_medications_keyed_on_name_and_dosage(self):
+        """Test that the same drug at different doses is kept."""
+        medications = [
+            {"name": "Ibuprofen", "dosage": "200 mg"},
+            {"name": "ibuprofen", "dosage": "400 mg"},
+            {"name": "IBUPROFEN", "dosage": "200 mg"},
+        ]
+
+        intake = _parse_extraction_result(
+            {"medications": medications}, "s1", len(HISTORY)
+        )
+
+        assert intake.medications == [
+            Medication(name="Ibuprofen", dosage="200 mg"),
+            Medication(name="ibuprofen", dosage="400 mg"),
+        ]
+
+
+class TestExtractIntakeData:
+    """Test concurrent per-section extraction."""
+
+    async def test_one_call_per_section(self, mock_model):
+        """Test that each section is requested separately."""
+        _respond(mock_model)
+
+        intake = await extract_intake_data(HISTORY, session_id="s1")
+
+        assert mock_model.generate_content_async.await_count == len(SECTIONS)
+        assert intake.session_id == "s1"
+        assert intake.status == "complete"
+
+    async def test_failed_call_loses_only_its_section(self, mock_model):
+        """Test that an exception from one call keeps the other sections."""
+        _respond(mock_model, medications=RuntimeError("quota"))
+
+        intake = await extract_intake_data(HISTORY)
+
+        assert intake.status == "incomplete"
+        assert intake.metadata.failed_sections == ["medications"]
+        assert intake.medications == []
+        assert intake.visit.symptoms == ["cough"]
+
+    async def test_unparseable_response_is_recorded(self, mock_model):
+        """Test that a non-JSON response marks its section failed."""
+        _respond(mock_model, allergies=SimpleNamespace(text="not json"))
+
+        intake = await extract_intake_data(HISTORY)
+
+        assert intake.metadata.failed_sections == ["allergies"]
+
+    async def test_empty_history_skips_model(self, mock_model):
+        """Test that no calls are made for an empty conversation."""
+        intake = await extract_intake_data([])
+
+        assert intake.status == "in_progress"
+        mock_model.generate_content_async.assert_not_called()
@@ -0,0 +1,243 @@
+"""
+Unit tests for services.session_store module.
+
+Tests the in-memory session store: LRU bound, TTL eviction, the active
+index and in-place updates.
+"""
+
+import asyncio
+import itertools
+import sys
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.app.models.messages import IntakeState, SessionState, SessionStatus
+from backend.app.services.session_store import SESSION_TTL_SECONDS, SessionStore
+
+# The package re-exports the store instance under the module's name
+store_module = sys.modules[SessionStore.__module__]
+
+ROOM_URL = "https://test.daily.co/room"
+
+TURN = {"turn_id": 1, "speaker": "patient", "text": "Hello", "state": "GREETING"}
+
+
+@pytest.fixture
+def store():
+    """Fresh, empty session store."""
+    return SessionStore()
+
+
+def _expire(store, session_id):
+    """Age a session past its TTL without touching the clock."""
+    store._sessions[session_id].last_seen -= SESSION_TTL_SECONDS + 1
+
+
+class TestCreateAndGet:
+    """Test session creation and lookup."""
+
+    async def test_create_returns_active_session(self, store):
+        """Test that a new session starts active in the greeting state."""
+        session = await store.create(room_url=ROOM_URL)
+
+        assert isinstance(session, SessionState)
+        assert session.status == SessionStatus.ACTIVE
+        assert session.current_state == IntakeState.GREETING
+        assert await store.get_room_url(session.session_id) == ROOM_URL
+
+    async def test_empty_token_is_stored_as_none(self, store):
+        """Test that an empty token is normalised to None."""
+        session = await store.create(room_url=ROOM_URL, token="")
+
+        assert await store.get_token(session.session_id) is None
+
+    async def test_get_unknown_session_returns_none(self, store):
+        """Test lookup of a missing session."""
+        assert await store.get("missing") is None
+
+
+class TestLRUBound:
+    """Test the MAX_SESSIONS bound."""
+
+    async def test_oldest_session_dropped_over_limit(self, store, monkeypatch):
+        """Test that the least recently used session is evicted first."""
+        monkeypatch.setattr(store_module, "MAX_SESSIONS", 2)
+        first = await store.create(room_url=ROOM_URL)
+        second = await store.create(room_url=ROOM_URL)
+
+        await store.get(first.session_id)
+        await store.create(room_url=ROOM_URL)
+
+        assert len(store) == 2
+        assert await store.get(first.session_id) is not None
+        assert await store.get(second.session_id) is None
+
+    async def test_evicted_session_leaves_active_index(self, store, monkeypatch):
+        """Test that LRU eviction also drops the session from list_active()."""
+        monkeypatch.setattr(store_module, "MAX_SESSIONS", 1)
+        first = await store.create(room_url=ROOM_URL)
+        second = await store.create(room_url=ROOM_URL)
+
+        active = await store.list_active()
+
+        assert [s.session_id for s in active] == [second.session_id]
+        assert first.session_id not in store._active
+
+
+class TestEvictExpired:
+    """Test TTL eviction."""
+
+    async def test_evicts_only_idle_sessions(self, store):
+        """Test that sessions past their TTL are dropped and others kept."""
+        stale = await store.create(room_url=ROOM_URL)
+        fresh = await store.create(room_url=ROOM_URL)
+        _expire(store, stale.session_id)
+
+        assert store.evict_expired() == 1
+        assert await store.get(stale.session_id) is None
+        assert await store.get(fresh.session_id) is not None
+        assert stale.session_id not in store._active
+
+    async def test_access_refreshes_ttl(self, store):
+        """Test that reading a session moves it out of the eviction window."""
+        session = await store.create(room_url=ROOM_URL)
+        _expire(store, session.session_id)
+
+        await store.get(session.session_id)
+
+        assert store.evict_expired() == 0
+
+    async def test_sweeper_calls_evict_expired(self, monkeypatch):
+        """Test that the app's background sweeper evicts on each interval."""
+        from backend.app import main
+
+        mock_store = MagicMock()
+        monkeypatch.setattr(main, "session_store", mock_store)
+        monkeypatch.setattr(main, "SESSION_SWEEP_INTERVAL", 0)
+
+        sweeper = asyncio.create_task(main._sweep_expired_sessions())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        sweeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await sweeper
+
+        assert mock_store.evict_expired.called
+
+
+class TestActiveIndex:
+    """Test the index behind list_active()."""
+
+    async def test_status_change_updates_index(self, store):
+        """Test that leaving and re-entering ACTIVE is reflected."""
+        session = await store.create(room_url=ROOM_URL)
+
+        await store.update(session.session_id, status=SessionStatus.COMPLETE)
+        assert await store.list_active() == []
+
+        await store.update(session.session_id, status=SessionStatus.ACTIVE)
+        active = await store.list_active()
+        assert [s.session_id for s in active] == [session.session_id]
+
+    async def test_delete_and_cleanup_clear_index(self, store):
+        """Test that delete() and cleanup_all() empty the index."""
+        deleted = await store.create(room_url=ROOM_URL)
+        await store.create(room_url=ROOM_URL)
+
+        assert await store.delete(deleted.session_id) is True
+        assert len(await store.list_active()) == 1
+
+        assert await store.cleanup_all() == 1
+        assert await store.list_active() == []
+
+
+class TestUpdate:
+    """Test in-place updates."""
+
+    async def test_update_unknown_session_returns_none(self, store):
+        """Test that updating a missing session returns None."""
+        assert await store.update("missing", status=SessionStatus.COMPLETE) is None
+
+    async def test_change_stamps_updated_at(self, store, monkeypatch):
+        """Test that a real change moves updated_at forward."""
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        ticks = (start + timedelta(seconds=i) for i in itertools.count())
+        monkeypatch.setattr(store_module, "utc_now", lambda: next(ticks))
+        session = await store.create(room_url=ROOM_URL)
+
+        updated = await store.update(
+            session.session_id, current_state=IntakeState.DEMOGRAPHICS
+        )
+
+        assert updated.current_state == IntakeState.DEMOGRAPHICS
+        assert session.updated_at == start
+        assert updated.updated_at == start + timedelta(seconds=1)
+
+    async def test_noop_keeps_updated_at(self, store):
+        """Test that setting an unchanged value does not stamp updated_at."""
+        session = await store.create(room_url=ROOM_URL)
+
+        updated = await store.update(session.session_id, status=SessionStatus.ACTIVE)
+
+        assert updated.updated_at == session.updated_at
+
+    async def test_timestamps_are_not_updatable(self, store):
+        """Test that created_at/updated_at can't be overwritten by callers."""
+        session = await store.create(room_url=ROOM_URL)
+
+        updated = await store.update(
+            session.session_id, created_at="bogus", updated_at="bogus"
+        )
+
+        assert updated == session
+
+    async def test_plain_values_are_coerced(self, store):
+        """Test that string status/state values are stored as enums."""
+        session = await store.create(room_url=ROOM_URL)
+
+        updated = await store.update(
+            session.session_id, status="complete", current_state="ALLERGIES"
+        )
+
+        assert updated.status is SessionStatus.COMPLETE
+        assert updated.current_state is IntakeState.ALLERGIES
+
+    async def test_invalid_value_leaves_session_untouched(self, store):
+        """Test that a bad value raises before the record is mutated."""
+        session = await store.create(room_url=ROOM_URL)
+
+        with pytest.raises(ValueError):
+            await store.update(
+                session.session_id,
+                current_state=IntakeState.VISIT_REASON,
+                status="bogus",
+            )
+
+        current = await store.get(session.session_id)
+        assert current == session
+
+    async def test_dict_turns_validated_once(self, store):
+        """Test that turns given as dicts are stored as validated models."""
+        session = await store.create(room_url=ROOM_URL)
+        await store.update(session.session_id, turns=[TURN])
+
+        first = await store.get(session.session_id)
+        second = await store.get(session.session_id)
+
+        assert first.turns[0].text == "Hello"
+        assert first.turns[0].timestamp_ns == second.turns[0].timestamp_ns
+
+    async def test_dict_turns_keep_their_timestamp(self, store):
+        """Test that a serialized turn's timestamp survives re-validation."""
+        session = await store.create(room_url=ROOM_URL)
+        turn = {**TURN, "timestamp": "2024-05-01T12:00:00.123456Z"}
+
+        updated = await store.update(session.session_id, turns=[turn])
+
+        assert updated.turns[0].timestamp_ns == 1714564800123456000
+        dumped = updated.turns[0].model_dump()
+        await store.update(session.session_id, turns=[dumped])
+        assert (await store.get(session.session_id)).turns[0] == updated.turns[0]
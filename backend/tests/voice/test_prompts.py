@@ -4,6 +4,9 @@ Unit tests for voice.llm.prompts module.
 Tests prompt generation and message formatting.
 """
 
+import re
+from types import MappingProxyType
+
 import pytest
 
 from backend.app.voice.llm.prompts import (
@@ -12,6 +15,49 @@ from backend.app.voice.llm.prompts import (
     get_greeting_message,
 )
 
+_PATIENT_RE = re.compile(r"patient|welcome|help", re.IGNORECASE)
+
+_VARIOUS_PROMPTS = (
+    "Short prompt",
+    "A much longer prompt that spans multiple words and concepts",
+    "Prompt with special chars: !@#$%^&*()",
+    "Prompt\nwith\nnewlines",
+)
+
+
+@pytest.fixture(scope="module")
+def sys_msg():
+    """Default system message, built once and shared read-only."""
+    return MappingProxyType(get_system_message())
+
+
+@pytest.fixture(scope="module")
+def greeting_msg():
+    """Greeting message, built once and shared read-only."""
+    return MappingProxyType(get_greeting_message())
+
+
+@pytest.fixture(scope="module")
+def prompt_lower():
+    """Lowercased medical intake prompt, computed once for the module."""
+    return MEDICAL_INTAKE_PROMPT.lower()
+
+
+@pytest.fixture(scope="module")
+def prompt_tokens(prompt_lower):
+    """Whitespace-separated words of the lowercased prompt."""
+    return frozenset(prompt_lower.split())
+
+
+@pytest.fixture(
+    scope="module",
+    params=[get_system_message, get_greeting_message],
+    ids=["system", "greeting"],
+)
+def message(request):
+    """Each prompt message factory's default output."""
+    return request.param()
+
 
 class TestPromptConstants:
     """Test prompt constant values."""
@@ -21,45 +67,41 @@ class TestPromptConstants:
         assert MEDICAL_INTAKE_PROMPT
         assert isinstance(MEDICAL_INTAKE_PROMPT, str)
 
-    def test_medical_intake_prompt_contains_key_terms(self):
+    def test_medical_intake_prompt_contains_key_terms(self, prompt_lower):
         """Test that medical prompt contains relevant keywords."""
-        prompt = MEDICAL_INTAKE_PROMPT
-        assert "medical" in prompt.lower()
-        assert "patient" in prompt.lower() or "information" in prompt.lower()
-        assert "voice" in prompt.lower() or "conversation" in prompt.lower()
+        assert "medical" in prompt_lower
+        assert "patient" in prompt_lower or "information" in prompt_lower
+        assert "voice" in prompt_lower or "conversation" in prompt_lower
 
-    def test_medical_intake_prompt_is_voice_focused(self):
+    def test_medical_intake_prompt_is_voice_focused(self, prompt_tokens):
         """Test that prompt mentions voice/brief responses."""
-        prompt = MEDICAL_INTAKE_PROMPT
-        assert any(
-            word in prompt.lower()
-            for word in ["voice", "brief", "sentence", "short"]
-        )
-
+        assert not prompt_tokens.isdisjoint({"voice", "brief", "sentence", "short"})
 
-class TestGetSystemMessage:
-    """Test get_system_message function."""
 
-    def test_returns_dict(self):
-        """Test that function returns a dictionary."""
-        result = get_system_message()
-        assert isinstance(result, dict)
+class TestMessageFormat:
+    """Test the shape shared by all prompt messages."""
 
-    def test_has_required_keys(self):
-        """Test that result has required keys."""
-        result = get_system_message()
-        assert "role" in result
-        assert "content" in result
+    def test_returns_dict(self, message):
+        """Test that the message is a dictionary."""
+        assert isinstance(message, dict)
 
-    def test_system_role_is_system(self):
+    def test_role_is_system(self, message):
         """Test that role is 'system'."""
-        result = get_system_message()
-        assert result["role"] == "system"
+        assert message["role"] == "system"
+
+    def test_message_format_is_openai_compatible(self, message):
+        """Test that message format is OpenAI-compatible."""
+        assert message.keys() == {"role", "content"}
+        assert isinstance(message["role"], str)
+        assert isinstance(message["content"], str)
 
-    def test_default_content_is_medical_prompt(self):
+
+class TestGetSystemMessage:
+    """Test get_system_message function."""
+
+    def test_default_content_is_medical_prompt(self, sys_msg):
         """Test that default content is the medical prompt."""
-        result = get_system_message()
-        assert result["content"] == MEDICAL_INTAKE_PROMPT
+        assert sys_msg["content"] == MEDICAL_INTAKE_PROMPT
 
     def test_custom_prompt(self):
         """Test with custom prompt."""
@@ -73,90 +115,45 @@ class TestGetSystemMessage:
         assert result["content"] == ""
         assert result["role"] == "system"
 
-    @pytest.mark.parametrize("prompt", [
-        "Short prompt",
-        "A much longer prompt that spans multiple words and concepts",
-        "Prompt with special chars: !@#$%^&*()",
-        "Prompt\nwith\nnewlines",
-    ])
+    @pytest.mark.parametrize(
+        "prompt", _VARIOUS_PROMPTS, ids=["short", "long", "special", "newlines"]
+    )
     def test_various_prompts(self, prompt):
         """Test get_system_message with various prompt formats."""
         result = get_system_message(prompt)
         assert result["content"] == prompt
         assert result["role"] == "system"
 
-    def test_message_format_is_openai_compatible(self):
-        """Test that message format is OpenAI-compatible."""
-        result = get_system_message()
-        # Should match OpenAI message format
-        assert isinstance(result, dict)
-        assert set(result.keys()) == {"role", "content"}
-        assert isinstance(result["role"], str)
-        assert isinstance(result["content"], str)
-
 
 class TestGetGreetingMessage:
     """Test get_greeting_message function."""
 
-    def test_returns_dict(self):
-        """Test that function returns a dictionary."""
-        result = get_greeting_message()
-        assert isinstance(result, dict)
-
-    def test_has_required_keys(self):
-        """Test that result has required keys."""
-        result = get_greeting_message()
-        assert "role" in result
-        assert "content" in result
-
-    def test_system_role_is_system(self):
-        """Test that role is 'system'."""
-        result = get_greeting_message()
-        assert result["role"] == "system"
-
-    def test_content_is_non_empty(self):
+    def test_content_is_non_empty(self, greeting_msg):
         """Test that content is not empty."""
-        result = get_greeting_message()
-        assert result["content"]
-        assert len(result["content"]) > 0
+        assert greeting_msg["content"]
+        assert len(greeting_msg["content"]) > 0
 
-    def test_greeting_mentions_greeting(self):
+    def test_greeting_mentions_greeting(self, greeting_msg):
         """Test that greeting message mentions greeting."""
-        result = get_greeting_message()
-        assert "greet" in result["content"].lower()
+        assert "greet" in greeting_msg["content"].lower()
 
-    def test_greeting_mentions_patient(self):
+    def test_greeting_mentions_patient(self, greeting_msg):
         """Test that greeting message is patient-focused."""
-        result = get_greeting_message()
-        content_lower = result["content"].lower()
-        assert any(word in content_lower for word in ["patient", "welcome", "help"])
-
-    def test_message_format_is_openai_compatible(self):
-        """Test that message format is OpenAI-compatible."""
-        result = get_greeting_message()
-        assert isinstance(result, dict)
-        assert set(result.keys()) == {"role", "content"}
-        assert isinstance(result["role"], str)
-        assert isinstance(result["content"], str)
+        assert _PATIENT_RE.search(greeting_msg["content"])
 
-    def test_greeting_is_different_from_system(self):
+    def test_greeting_is_different_from_system(self, greeting_msg, sys_msg):
         """Test that greeting is different from system message."""
-        greeting = get_greeting_message()
-        system = get_system_message()
-        assert greeting["content"] != system["content"]
+        assert greeting_msg["content"] != sys_msg["content"]
         # Both should be system role
-        assert greeting["role"] == system["role"] == "system"
+        assert greeting_msg["role"] == sys_msg["role"] == "system"
 
 
 class TestPromptIntegration:
     """Test prompt functions together."""
 
-    def test_can_build_conversation_start(self):
+    def test_can_build_conversation_start(self, sys_msg, greeting_msg):
         """Test building initial conversation with system + greeting."""
-        system_msg = get_system_message()
-        greeting_msg = get_greeting_message()
-
-        conversation = [system_msg, greeting_msg]
+        conversation = [sys_msg, greeting_msg]
 
         assert len(conversation) == 2
         assert conversation[0]["role"] == "system"
@@ -5,9 +5,31 @@ Tests Speech-to-Text service factory and configuration.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
-from backend.app.voice.stt import create_stt_service
+from backend.app.voice.stt import ENDPOINTING_MS, create_stt_service
+
+_LONG = "x" * 1000
+
+MODELS = (
+    "nova-2-general",
+    "nova-2-conversationalai",
+    "nova-2-medical",
+    "nova-2-diarization",
+    "nova-1",
+)
+
+LANGUAGES = (
+    "en-US",
+    "en-GB",
+    "es-ES",
+    "fr-FR",
+    "de-DE",
+    "it-IT",
+    "pt-BR",
+    "ja-JP",
+    "zh-CN",
+)
 
 
 class TestCreateSTTService:
@@ -21,28 +43,19 @@ class TestCreateSTTService:
         # Check that the mock was called
         assert mock_deepgram_stt_service.called
 
-    def test_uses_settings_api_key(self, mock_settings, mock_deepgram_stt_service):
-        """Test that service is created with API key from settings."""
-        create_stt_service()
-
-        # Verify DeepgramSTTService was instantiated with api_key parameter
-        call_kwargs = mock_deepgram_stt_service.call_args.kwargs
-        assert "api_key" in call_kwargs
-        assert isinstance(call_kwargs["api_key"], str)
-
-    def test_default_model_is_nova_2_general(self, mock_settings, mock_deepgram_stt_service):
-        """Test default model is nova-2-general."""
-        create_stt_service()
-
-        call_kwargs = mock_deepgram_stt_service.call_args.kwargs
-        assert call_kwargs["model"] == "nova-2-general"
-
-    def test_default_language_is_en_us(self, mock_settings, mock_deepgram_stt_service):
-        """Test default language is en-US."""
+    @pytest.mark.parametrize("field, expected", [
+        ("api_key", "test-deepgram-key"),
+        ("model", "nova-2-general"),
+        ("language", "en-US"),
+    ])
+    def test_default_kwargs(
+        self, mock_settings, mock_deepgram_stt_service, field, expected
+    ):
+        """Test the API key from settings and the default model and language."""
         create_stt_service()
 
         call_kwargs = mock_deepgram_stt_service.call_args.kwargs
-        assert call_kwargs["language"] == "en-US"
+        assert call_kwargs[field] == expected
 
     def test_custom_model_parameter(self, mock_settings, mock_deepgram_stt_service):
         """Test with custom model parameter."""
@@ -62,37 +75,17 @@ class TestCreateSTTService:
         call_kwargs = mock_deepgram_stt_service.call_args.kwargs
         assert call_kwargs["language"] == custom_language
 
-    @pytest.mark.parametrize("model", [
-        "nova-2-general",
-        "nova-2-conversationalai",
-        "nova-2-medical",
-        "nova-2-diarization",
-        "nova-1",
-    ])
-    def test_various_models(self, mock_settings, mock_deepgram_stt_service, model):
-        """Test service creation with various Deepgram models."""
-        create_stt_service(model=model)
+    @pytest.mark.parametrize(
+        "field, value",
+        [("model", model) for model in MODELS]
+        + [("language", language) for language in LANGUAGES],
+    )
+    def test_kwarg_passthrough(self, mock_settings, mock_deepgram_stt_service, field, value):
+        """Test that model and language values are passed through unchanged."""
+        create_stt_service(**{field: value})
 
         call_kwargs = mock_deepgram_stt_service.call_args.kwargs
-        assert call_kwargs["model"] == model
-
-    @pytest.mark.parametrize("language", [
-        "en-US",
-        "en-GB",
-        "es-ES",
-        "fr-FR",
-        "de-DE",
-        "it-IT",
-        "pt-BR",
-        "ja-JP",
-        "zh-CN",
-    ])
-    def test_various_languages(self, mock_settings, mock_deepgram_stt_service, language):
-        """Test service creation with various languages."""
-        create_stt_service(language=language)
-
-        call_kwargs = mock_deepgram_stt_service.call_args.kwargs
-        assert call_kwargs["language"] == language
+        assert call_kwargs[field] == value
 
     def test_both_custom_parameters(self, mock_settings, mock_deepgram_stt_service):
         """Test with both custom model and language."""
@@ -108,20 +101,49 @@ class TestCreateSTTService:
         # mock_settings fixture patches get_settings
         assert mock_settings is not None
 
+    def test_uses_injected_settings(self, mock_deepgram_stt_service):
+        """Test that injected settings are used instead of get_settings()."""
+        settings = MagicMock(deepgram_api_key="injected-key")
+
+        create_stt_service(settings=settings)
+
+        call_kwargs = mock_deepgram_stt_service.call_args.kwargs
+        assert call_kwargs["api_key"] == "injected-key"
+
     def test_service_instantiation_called_once(self, mock_settings, mock_deepgram_stt_service):
         """Test that DeepgramSTTService is instantiated once."""
         create_stt_service()
         assert mock_deepgram_stt_service.call_count == 1
 
     def test_only_required_params_passed(self, mock_settings, mock_deepgram_stt_service):
-        """Test that exactly 3 parameters are passed."""
+        """Test that exactly 4 parameters are passed."""
         create_stt_service()
 
         call_kwargs = mock_deepgram_stt_service.call_args.kwargs
-        assert len(call_kwargs) == 3
+        assert len(call_kwargs) == 4
         assert "api_key" in call_kwargs
         assert "model" in call_kwargs
         assert "language" in call_kwargs
+        assert "live_options" in call_kwargs
+
+    def test_live_options_enable_fast_endpointing(
+        self, monkeypatch, mock_settings, mock_deepgram_stt_service
+    ):
+        """Test that live options request short endpointing and interim results."""
+        mock_live_options = MagicMock()
+        monkeypatch.setattr("backend.app.voice.stt.LiveOptions", mock_live_options)
+
+        create_stt_service(model="nova-2-medical", language="es-ES")
+
+        options_kwargs = mock_live_options.call_args.kwargs
+        assert options_kwargs["model"] == "nova-2-medical"
+        assert options_kwargs["language"] == "es-ES"
+        assert options_kwargs["endpointing"] == ENDPOINTING_MS
+        assert options_kwargs["interim_results"] is True
+        assert options_kwargs["no_delay"] is True
+        assert "vad_events" not in options_kwargs
+        call_kwargs = mock_deepgram_stt_service.call_args.kwargs
+        assert call_kwargs["live_options"] is mock_live_options.return_value
 
 
 class TestSTTServiceIntegration:
@@ -131,8 +153,6 @@ class TestSTTServiceIntegration:
         self, mock_settings, mock_deepgram_stt_service
     ):
         """Test that multiple calls create independent instances."""
-        mock_deepgram_stt_service.reset_mock()
-
         service1 = create_stt_service(model="nova-2-general")
         service2 = create_stt_service(model="nova-2-medical")
 
@@ -141,23 +161,16 @@ class TestSTTServiceIntegration:
         assert calls[0].kwargs["model"] == "nova-2-general"
         assert calls[1].kwargs["model"] == "nova-2-medical"
 
+    @pytest.mark.parametrize("model, language", list(zip(MODELS[:3], LANGUAGES[:3])))
     def test_model_and_language_combinations(
-        self, mock_settings, mock_deepgram_stt_service
+        self, mock_settings, mock_deepgram_stt_service, model, language
     ):
         """Test various model and language combinations."""
-        combinations = [
-            ("nova-2-general", "en-US"),
-            ("nova-2-medical", "es-ES"),
-            ("nova-2-conversationalai", "fr-FR"),
-        ]
-
-        for model, language in combinations:
-            mock_deepgram_stt_service.reset_mock()
-            create_stt_service(model=model, language=language)
+        create_stt_service(model=model, language=language)
 
-            call_kwargs = mock_deepgram_stt_service.call_args.kwargs
-            assert call_kwargs["model"] == model
-            assert call_kwargs["language"] == language
+        call_kwargs = mock_deepgram_stt_service.call_args.kwargs
+        assert call_kwargs["model"] == model
+        assert call_kwargs["language"] == language
 
     def test_medical_use_case(self, mock_settings, mock_deepgram_stt_service):
         """Test STT service for medical use case."""
@@ -204,10 +217,8 @@ class TestCreateSTTServiceEdgeCases:
 
     def test_very_long_parameters(self, mock_settings, mock_deepgram_stt_service):
         """Test with very long parameter strings."""
-        long_string = "x" * 1000
-
-        create_stt_service(model=long_string, language=long_string)
+        create_stt_service(model=_LONG, language=_LONG)
 
         call_kwargs = mock_deepgram_stt_service.call_args.kwargs
-        assert call_kwargs["model"] == long_string
-        assert call_kwargs["language"] == long_string
+        assert call_kwargs["model"] is _LONG
+        assert call_kwargs["language"] is _LONG
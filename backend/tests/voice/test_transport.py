@@ -4,142 +4,95 @@ Unit tests for voice.transport module.
 Tests WebRTC transport factory.
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import ANY
 
 from backend.app.voice.transport import create_transport
 
+pytestmark = pytest.mark.fast
 
-class TestCreateTransport:
-    """Test create_transport factory function."""
-
-    def test_returns_daily_transport_instance(
-        self, mock_daily_transport, mock_daily_params
-    ):
-        """Test that function returns DailyTransport instance."""
-        room_url = "https://example.daily.co/test-room"
-
-        result = create_transport(room_url)
-
-        assert mock_daily_transport.called
-
-    def test_uses_provided_room_url(self, mock_daily_transport, mock_daily_params):
-        """Test that room_url is passed to transport."""
-        room_url = "https://example.daily.co/test-room"
+DEFAULT_ROOM_URL = "https://example.daily.co/test-room"
 
-        create_transport(room_url)
+_LONG = "x" * 1000
+_LONG_URL = "https://example.daily.co/" + _LONG
 
-        call_kwargs = mock_daily_transport.call_args.kwargs
-        assert call_kwargs["room_url"] == room_url
+ROOM_URLS = (
+    "https://example.daily.co/room1",
+    "https://example.daily.co/room2",
+    "https://custom.daily.co/test",
+    "https://daily.co/abc123",
+)
 
-    def test_default_bot_name_is_medvoice(
-        self, mock_daily_transport, mock_daily_params
-    ):
-        """Test default bot_name is 'MedVoice'."""
-        room_url = "https://example.daily.co/test-room"
-
-        create_transport(room_url)
-
-        call_kwargs = mock_daily_transport.call_args.kwargs
-        assert call_kwargs["bot_name"] == "MedVoice"
+BOT_NAMES = ("MedVoice", "Assistant", "MedBot", "HealthBot")
 
-    def test_custom_bot_name(self, mock_daily_transport, mock_daily_params):
-        """Test with custom bot_name."""
-        room_url = "https://example.daily.co/test-room"
-        custom_name = "MedBot"
+# Stand-in for a caller-supplied VAD analyzer; only its identity matters
+_CUSTOM_VAD = object()
 
-        create_transport(room_url, bot_name=custom_name)
 
-        call_kwargs = mock_daily_transport.call_args.kwargs
-        assert call_kwargs["bot_name"] == custom_name
+@pytest.fixture
+def default_transport_call(mock_daily_transport, mock_daily_params):
+    """Call create_transport with defaults and capture the constructor kwargs."""
+    create_transport(DEFAULT_ROOM_URL)
+    return SimpleNamespace(
+        transport_kwargs=mock_daily_transport.call_args.kwargs,
+        params_kwargs=mock_daily_params.call_args.kwargs,
+    )
 
-    def test_token_is_none(self, mock_daily_transport, mock_daily_params):
-        """Test that token is None (not required for this setup)."""
-        room_url = "https://example.daily.co/test-room"
 
-        create_transport(room_url)
+class TestCreateTransport:
+    """Test create_transport factory function."""
 
-        call_kwargs = mock_daily_transport.call_args.kwargs
-        assert call_kwargs["token"] is None
+    def test_returns_daily_transport_instance(
+        self, mock_daily_transport, default_transport_call
+    ):
+        """Test that function returns DailyTransport instance."""
+        assert mock_daily_transport.called
 
-    def test_creates_vad_analyzer_by_default(self, mock_daily_transport, mock_daily_params):
+    def test_default_call_kwargs(self, mock_daily_params, default_transport_call):
+        """Test the full set of kwargs passed to DailyTransport and DailyParams."""
+        assert default_transport_call.transport_kwargs == {
+            "room_url": DEFAULT_ROOM_URL,
+            "token": None,
+            "bot_name": "MedVoice",
+            "params": mock_daily_params.return_value,
+        }
+        assert default_transport_call.params_kwargs == {
+            "audio_in_enabled": True,
+            "audio_out_enabled": True,
+            "vad_enabled": True,
+            "vad_analyzer": ANY,
+        }
+
+    def test_creates_vad_analyzer_by_default(
+        self, mock_daily_transport, mock_daily_params, mock_create_vad_analyzer
+    ):
         """Test that VAD analyzer is created by default."""
-        room_url = "https://example.daily.co/test-room"
-
-        with patch("backend.app.voice.transport.create_vad_analyzer") as mock_create_vad:
-            create_transport(room_url)
+        create_transport(DEFAULT_ROOM_URL)
 
-            mock_create_vad.assert_called_once()
+        mock_create_vad_analyzer.assert_called_once()
 
     def test_uses_provided_vad_analyzer(self, mock_daily_transport, mock_daily_params):
         """Test with provided VAD analyzer."""
-        room_url = "https://example.daily.co/test-room"
-        custom_vad = MagicMock()
+        custom_vad = _CUSTOM_VAD
 
-        create_transport(room_url, vad_analyzer=custom_vad)
+        create_transport(DEFAULT_ROOM_URL, vad_analyzer=custom_vad)
 
-        # Should not create new one if provided
-        call_kwargs = mock_daily_transport.call_args.kwargs
-        params_obj = call_kwargs["params"]
+        call_kwargs = mock_daily_params.call_args.kwargs
+        assert call_kwargs["vad_analyzer"] is custom_vad
 
-    def test_creates_daily_params(self, mock_daily_transport, mock_daily_params):
+    def test_creates_daily_params(self, mock_daily_params, default_transport_call):
         """Test that DailyParams is created."""
-        room_url = "https://example.daily.co/test-room"
-
-        create_transport(room_url)
-
         assert mock_daily_params.called
 
-    def test_daily_params_audio_in_enabled(self, mock_daily_transport, mock_daily_params):
-        """Test that audio_in_enabled is True."""
-        room_url = "https://example.daily.co/test-room"
-
-        create_transport(room_url)
-
-        call_kwargs = mock_daily_params.call_args.kwargs
-        assert call_kwargs["audio_in_enabled"] is True
-
-    def test_daily_params_audio_out_enabled(self, mock_daily_transport, mock_daily_params):
-        """Test that audio_out_enabled is True."""
-        room_url = "https://example.daily.co/test-room"
-
-        create_transport(room_url)
-
-        call_kwargs = mock_daily_params.call_args.kwargs
-        assert call_kwargs["audio_out_enabled"] is True
-
-    def test_daily_params_vad_enabled(self, mock_daily_transport, mock_daily_params):
-        """Test that vad_enabled is True."""
-        room_url = "https://example.daily.co/test-room"
-
-        create_transport(room_url)
-
-        call_kwargs = mock_daily_params.call_args.kwargs
-        assert call_kwargs["vad_enabled"] is True
-
-    def test_daily_params_has_vad_analyzer(self, mock_daily_transport, mock_daily_params):
-        """Test that vad_analyzer is included in params."""
-        room_url = "https://example.daily.co/test-room"
-
-        create_transport(room_url)
-
-        call_kwargs = mock_daily_params.call_args.kwargs
-        assert "vad_analyzer" in call_kwargs
-
-    def test_transport_instantiation_called_once(self, mock_daily_transport, mock_daily_params):
+    def test_transport_instantiation_called_once(
+        self, mock_daily_transport, default_transport_call
+    ):
         """Test that DailyTransport is instantiated once."""
-        room_url = "https://example.daily.co/test-room"
-
-        create_transport(room_url)
-
         assert mock_daily_transport.call_count == 1
 
-    @pytest.mark.parametrize("room_url", [
-        "https://example.daily.co/room1",
-        "https://example.daily.co/room2",
-        "https://custom.daily.co/test",
-        "https://daily.co/abc123",
-    ])
+    @pytest.mark.parametrize("room_url", ROOM_URLS)
     def test_various_room_urls(
         self, mock_daily_transport, mock_daily_params, room_url
     ):
@@ -149,19 +102,12 @@ class TestCreateTransport:
         call_kwargs = mock_daily_transport.call_args.kwargs
         assert call_kwargs["room_url"] == room_url
 
-    @pytest.mark.parametrize("bot_name", [
-        "MedVoice",
-        "Assistant",
-        "MedBot",
-        "HealthBot",
-    ])
+    @pytest.mark.parametrize("bot_name", BOT_NAMES)
     def test_various_bot_names(
         self, mock_daily_transport, mock_daily_params, bot_name
     ):
         """Test with various bot names."""
-        room_url = "https://example.daily.co/test-room"
-
-        create_transport(room_url, bot_name=bot_name)
+        create_transport(DEFAULT_ROOM_URL, bot_name=bot_name)
 
         call_kwargs = mock_daily_transport.call_args.kwargs
         assert call_kwargs["bot_name"] == bot_name
@@ -184,8 +130,6 @@ class TestTransportIntegration:
         self, mock_daily_transport, mock_daily_params
     ):
         """Test that multiple transports are independent."""
-        mock_daily_transport.reset_mock()
-
         url1 = "https://example.daily.co/room1"
         url2 = "https://example.daily.co/room2"
 
@@ -203,70 +147,33 @@ class TestTransportIntegration:
 class TestCreateTransportEdgeCases:
     """Test edge cases for transport creation."""
 
-    def test_empty_bot_name(self, mock_daily_transport, mock_daily_params):
-        """Test with empty bot name."""
-        room_url = "https://example.daily.co/test-room"
-
-        create_transport(room_url, bot_name="")
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"room_url": DEFAULT_ROOM_URL, "bot_name": "MedBot"},
+            {"room_url": DEFAULT_ROOM_URL, "bot_name": ""},
+            {"room_url": DEFAULT_ROOM_URL, "bot_name": _LONG},
+            {"room_url": DEFAULT_ROOM_URL, "bot_name": "Bot-v2.0_Test!@#$"},
+            {"room_url": DEFAULT_ROOM_URL, "bot_name": "MedBot-医疗机器人"},
+            {"room_url": _LONG_URL},
+        ],
+        ids=["custom", "empty", "long", "special", "unicode", "long-url"],
+    )
+    def test_kwargs_forwarded(self, mock_daily_transport, mock_daily_params, kwargs):
+        """Test that room_url and bot_name reach DailyTransport unchanged."""
+        create_transport(**kwargs)
 
         call_kwargs = mock_daily_transport.call_args.kwargs
-        assert call_kwargs["bot_name"] == ""
-
-    def test_very_long_room_url(self, mock_daily_transport, mock_daily_params):
-        """Test with very long room URL."""
-        long_url = "https://example.daily.co/" + "x" * 1000
+        for key, value in kwargs.items():
+            assert call_kwargs[key] is value
 
-        create_transport(long_url)
-
-        call_kwargs = mock_daily_transport.call_args.kwargs
-        assert call_kwargs["room_url"] == long_url
-
-    def test_very_long_bot_name(self, mock_daily_transport, mock_daily_params):
-        """Test with very long bot name."""
-        long_name = "x" * 1000
-
-        create_transport("https://example.daily.co/test", bot_name=long_name)
-
-        call_kwargs = mock_daily_transport.call_args.kwargs
-        assert call_kwargs["bot_name"] == long_name
-
-    def test_special_characters_in_bot_name(self, mock_daily_transport, mock_daily_params):
-        """Test with special characters in bot name."""
-        room_url = "https://example.daily.co/test-room"
-        special_name = "Bot-v2.0_Test!@#$"
-
-        create_transport(room_url, bot_name=special_name)
-
-        call_kwargs = mock_daily_transport.call_args.kwargs
-        assert call_kwargs["bot_name"] == special_name
-
-    def test_unicode_bot_name(self, mock_daily_transport, mock_daily_params):
-        """Test with Unicode characters in bot name."""
-        room_url = "https://example.daily.co/test-room"
-        unicode_name = "MedBot-医疗机器人"
-
-        create_transport(room_url, bot_name=unicode_name)
-
-        call_kwargs = mock_daily_transport.call_args.kwargs
-        assert call_kwargs["bot_name"] == unicode_name
-
-    def test_custom_vad_analyzer_is_used(self, mock_daily_transport, mock_daily_params):
+    def test_custom_vad_analyzer_is_used(
+        self, mock_daily_transport, mock_daily_params, mock_create_vad_analyzer
+    ):
         """Test that custom VAD analyzer is used when provided."""
-        room_url = "https://example.daily.co/test-room"
-        custom_vad = MagicMock()
+        custom_vad = _CUSTOM_VAD
 
-        with patch("backend.app.voice.transport.create_vad_analyzer") as mock_create_vad:
-            create_transport(room_url, vad_analyzer=custom_vad)
+        create_transport(DEFAULT_ROOM_URL, vad_analyzer=custom_vad)
 
-            # create_vad_analyzer should not be called when custom vad is provided
-            mock_create_vad.assert_not_called()
-
-    def test_params_passed_to_transport(self, mock_daily_transport, mock_daily_params):
-        """Test that params object is passed to transport."""
-        room_url = "https://example.daily.co/test-room"
-
-        create_transport(room_url)
-
-        call_kwargs = mock_daily_transport.call_args.kwargs
-        assert "params" in call_kwargs
-        assert call_kwargs["params"] is not None
+        # create_vad_analyzer should not be called when custom vad is provided
+        mock_create_vad_analyzer.assert_not_called()
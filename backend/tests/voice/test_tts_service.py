@@ -5,37 +5,51 @@ Tests Text-to-Speech service factory and configuration.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 from backend.app.voice.tts import create_tts_service
 
+pytestmark = pytest.mark.fast
+
+_LONG = "x" * 1000
+
+AURA_VOICES = (
+    "aura-asteria-en",
+    "aura-luna-en",
+    "aura-stella-en",
+    "aura-ember-en",
+    "aura-orion-en",
+    "aura-arcas-en",
+    "aura-perseus-en",
+    "aura-angus-en",
+    "aura-opheus-en",
+    "aura-athena-en",
+)
+
+
+@pytest.fixture
+def default_tts_call(mock_settings, mock_deepgram_tts_service):
+    """Call create_tts_service with defaults and capture the constructor kwargs."""
+    create_tts_service()
+    return mock_deepgram_tts_service.call_args.kwargs
+
 
 class TestCreateTTSService:
     """Test create_tts_service factory function."""
 
     def test_returns_deepgram_tts_service_instance(
-        self, mock_settings, mock_deepgram_tts_service
+        self, mock_deepgram_tts_service, default_tts_call
     ):
         """Test that function returns DeepgramTTSService instance."""
-        result = create_tts_service()
-        # Check that the mock was called
         assert mock_deepgram_tts_service.called
 
-    def test_uses_settings_api_key(self, mock_settings, mock_deepgram_tts_service):
-        """Test that service is created with API key from settings."""
-        create_tts_service()
-
-        # Verify DeepgramTTSService was instantiated with api_key parameter
-        call_kwargs = mock_deepgram_tts_service.call_args.kwargs
-        assert "api_key" in call_kwargs
-        assert isinstance(call_kwargs["api_key"], str)
-
-    def test_default_voice_is_aura_asteria_en(self, mock_settings, mock_deepgram_tts_service):
-        """Test default voice is aura-asteria-en."""
-        create_tts_service()
-
-        call_kwargs = mock_deepgram_tts_service.call_args.kwargs
-        assert call_kwargs["voice"] == "aura-asteria-en"
+    @pytest.mark.parametrize("key, expected", [
+        ("api_key", "test-deepgram-key"),
+        ("voice", "aura-asteria-en"),
+    ])
+    def test_default_kwargs(self, default_tts_call, key, expected):
+        """Test the API key from settings and the default voice."""
+        assert default_tts_call[key] == expected
 
     def test_custom_voice_parameter(self, mock_settings, mock_deepgram_tts_service):
         """Test with custom voice parameter."""
@@ -46,18 +60,7 @@ class TestCreateTTSService:
         call_kwargs = mock_deepgram_tts_service.call_args.kwargs
         assert call_kwargs["voice"] == custom_voice
 
-    @pytest.mark.parametrize("voice", [
-        "aura-asteria-en",
-        "aura-luna-en",
-        "aura-stella-en",
-        "aura-ember-en",
-        "aura-orion-en",
-        "aura-arcas-en",
-        "aura-perseus-en",
-        "aura-angus-en",
-        "aura-opheus-en",
-        "aura-athena-en",
-    ])
+    @pytest.mark.parametrize("voice", AURA_VOICES)
     def test_various_voices(self, mock_settings, mock_deepgram_tts_service, voice):
         """Test service creation with various Deepgram voices."""
         create_tts_service(voice=voice)
@@ -71,19 +74,26 @@ class TestCreateTTSService:
         # mock_settings fixture patches get_settings
         assert mock_settings is not None
 
-    def test_service_instantiation_called_once(self, mock_settings, mock_deepgram_tts_service):
+    def test_uses_injected_settings(self, mock_deepgram_tts_service):
+        """Test that injected settings are used instead of get_settings()."""
+        settings = MagicMock(deepgram_api_key="injected-key")
+
+        create_tts_service(settings=settings)
+
+        call_kwargs = mock_deepgram_tts_service.call_args.kwargs
+        assert call_kwargs["api_key"] == "injected-key"
+
+    def test_service_instantiation_called_once(
+        self, mock_deepgram_tts_service, default_tts_call
+    ):
         """Test that DeepgramTTSService is instantiated once."""
-        create_tts_service()
         assert mock_deepgram_tts_service.call_count == 1
 
-    def test_only_required_params_passed(self, mock_settings, mock_deepgram_tts_service):
+    def test_only_required_params_passed(self, default_tts_call):
         """Test that exactly 2 parameters are passed."""
-        create_tts_service()
-
-        call_kwargs = mock_deepgram_tts_service.call_args.kwargs
-        assert len(call_kwargs) == 2
-        assert "api_key" in call_kwargs
-        assert "voice" in call_kwargs
+        assert len(default_tts_call) == 2
+        assert "api_key" in default_tts_call
+        assert "voice" in default_tts_call
 
 
 class TestTTSServiceIntegration:
@@ -93,10 +103,8 @@ class TestTTSServiceIntegration:
         self, mock_settings, mock_deepgram_tts_service
     ):
         """Test that multiple calls create independent instances."""
-        mock_deepgram_tts_service.reset_mock()
-
-        service1 = create_tts_service(voice="aura-asteria-en")
-        service2 = create_tts_service(voice="aura-luna-en")
+        create_tts_service(voice="aura-asteria-en")
+        create_tts_service(voice="aura-luna-en")
 
         assert mock_deepgram_tts_service.call_count == 2
         calls = mock_deepgram_tts_service.call_args_list
@@ -140,24 +148,19 @@ class TestCreateTTSServiceEdgeCases:
 
     def test_very_long_voice_name(self, mock_settings, mock_deepgram_tts_service):
         """Test with very long voice name."""
-        long_voice = "x" * 1000
-
-        create_tts_service(voice=long_voice)
+        create_tts_service(voice=_LONG)
 
         call_kwargs = mock_deepgram_tts_service.call_args.kwargs
-        assert call_kwargs["voice"] == long_voice
+        assert call_kwargs["voice"] is _LONG
 
-    def test_case_sensitivity(self, mock_settings, mock_deepgram_tts_service):
+    @pytest.mark.parametrize("voice", [
+        "AURA-ASTERIA-EN",
+        "Aura-Luna-En",
+        "aura-stella-en",
+    ])
+    def test_case_sensitivity(self, mock_settings, mock_deepgram_tts_service, voice):
         """Test that voice names preserve case."""
-        voices = [
-            "AURA-ASTERIA-EN",
-            "Aura-Luna-En",
-            "aura-stella-en",
-        ]
-
-        for voice in voices:
-            mock_deepgram_tts_service.reset_mock()
-            create_tts_service(voice=voice)
-
-            call_kwargs = mock_deepgram_tts_service.call_args.kwargs
-            assert call_kwargs["voice"] == voice
+        create_tts_service(voice=voice)
+
+        call_kwargs = mock_deepgram_tts_service.call_args.kwargs
+        assert call_kwargs["voice"] == voice
@@ -4,33 +4,43 @@ Unit tests for voice.vad module.
 Tests Voice Activity Detection factory.
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch, MagicMock, call
 
 from backend.app.voice.vad import create_vad_analyzer
 
+pytestmark = pytest.mark.fast
+
+STOP_SECS_VALUES = (0.1, 0.2, 0.3, 0.5, 0.7, 1.0, 1.5, 2.0)
+
+
+@pytest.fixture
+def default_vad_call(mock_silero_vad_analyzer, mock_vad_params):
+    """Call create_vad_analyzer with defaults and capture the constructor kwargs."""
+    create_vad_analyzer()
+    return SimpleNamespace(
+        analyzer_kwargs=mock_silero_vad_analyzer.call_args.kwargs,
+        params_kwargs=mock_vad_params.call_args.kwargs,
+    )
+
 
 class TestCreateVADAnalyzer:
     """Test create_vad_analyzer factory function."""
 
     def test_returns_silero_vad_analyzer_instance(
-        self, mock_silero_vad_analyzer, mock_vad_params
+        self, mock_silero_vad_analyzer, default_vad_call
     ):
         """Test that function returns SileroVADAnalyzer instance."""
-        result = create_vad_analyzer()
         assert mock_silero_vad_analyzer.called
 
-    def test_creates_vad_params(self, mock_silero_vad_analyzer, mock_vad_params):
+    def test_creates_vad_params(self, mock_vad_params, default_vad_call):
         """Test that VADParams is created."""
-        create_vad_analyzer()
         assert mock_vad_params.called
 
-    def test_default_stop_secs_is_0_3(self, mock_silero_vad_analyzer, mock_vad_params):
+    def test_default_stop_secs_is_0_3(self, default_vad_call):
         """Test default stop_secs is 0.3."""
-        create_vad_analyzer()
-
-        call_kwargs = mock_vad_params.call_args.kwargs
-        assert call_kwargs["stop_secs"] == 0.3
+        assert default_vad_call.params_kwargs["stop_secs"] == 0.3
 
     def test_custom_stop_secs_parameter(self, mock_silero_vad_analyzer, mock_vad_params):
         """Test with custom stop_secs parameter."""
@@ -41,16 +51,7 @@ class TestCreateVADAnalyzer:
         call_kwargs = mock_vad_params.call_args.kwargs
         assert call_kwargs["stop_secs"] == 0.5
 
-    @pytest.mark.parametrize("stop_secs", [
-        0.1,
-        0.2,
-        0.3,
-        0.5,
-        0.7,
-        1.0,
-        1.5,
-        2.0,
-    ])
+    @pytest.mark.parametrize("stop_secs", STOP_SECS_VALUES)
     def test_various_stop_secs_values(
         self, mock_silero_vad_analyzer, mock_vad_params, stop_secs
     ):
@@ -60,38 +61,24 @@ class TestCreateVADAnalyzer:
         call_kwargs = mock_vad_params.call_args.kwargs
         assert call_kwargs["stop_secs"] == stop_secs
 
-    def test_vad_params_passed_to_analyzer(
-        self, mock_silero_vad_analyzer, mock_vad_params
-    ):
+    def test_vad_params_passed_to_analyzer(self, default_vad_call):
         """Test that VADParams is passed to SileroVADAnalyzer."""
-        create_vad_analyzer()
-
-        # Check that SileroVADAnalyzer was called with params kwarg
-        call_kwargs = mock_silero_vad_analyzer.call_args.kwargs
-        assert "params" in call_kwargs
+        assert "params" in default_vad_call.analyzer_kwargs
 
     def test_analyzer_instantiation_called_once(
-        self, mock_silero_vad_analyzer, mock_vad_params
+        self, mock_silero_vad_analyzer, default_vad_call
     ):
         """Test that SileroVADAnalyzer is instantiated once."""
-        create_vad_analyzer()
         assert mock_silero_vad_analyzer.call_count == 1
 
-    def test_params_instantiation_called_once(
-        self, mock_silero_vad_analyzer, mock_vad_params
-    ):
+    def test_params_instantiation_called_once(self, mock_vad_params, default_vad_call):
         """Test that VADParams is instantiated once."""
-        create_vad_analyzer()
         assert mock_vad_params.call_count == 1
 
     def test_vad_params_created_before_analyzer(
         self, mock_silero_vad_analyzer, mock_vad_params
     ):
         """Test that VADParams is created before SileroVADAnalyzer."""
-        # Reset call history
-        mock_vad_params.reset_mock()
-        mock_silero_vad_analyzer.reset_mock()
-
         create_vad_analyzer()
 
         # Check call order: VADParams should be called first
@@ -106,11 +93,8 @@ class TestVADAnalyzerIntegration:
         self, mock_silero_vad_analyzer, mock_vad_params
     ):
         """Test that multiple calls create independent instances."""
-        mock_silero_vad_analyzer.reset_mock()
-        mock_vad_params.reset_mock()
-
-        analyzer1 = create_vad_analyzer(stop_secs=0.3)
-        analyzer2 = create_vad_analyzer(stop_secs=0.5)
+        create_vad_analyzer(stop_secs=0.3)
+        create_vad_analyzer(stop_secs=0.5)
 
         assert mock_silero_vad_analyzer.call_count == 2
         assert mock_vad_params.call_count == 2
@@ -8,7 +8,7 @@ echo ========================================
 echo.
 
 echo [1/2] Starting Backend on port 8080 (WSL)...
-start wt wsl -d Ubuntu -- bash -c "source ~/.local/bin/env && cd /mnt/c/Users/User/Projects/MedVoice && echo '=== MedVoice Backend (port 8080) ===' && uv run python -m uvicorn backend.app.main:app --host 0.0.0.0 --port 8080"
+start wt wsl -d Ubuntu -- bash -c "source ~/.local/bin/env && cd /mnt/c/Users/User/Projects/MedVoice && echo '=== MedVoice Backend (port 8080) ===' && uv run python -m uvicorn backend.app.main:app --host 0.0.0.0 --port 8080 --loop uvloop --http httptools"
 
 echo Waiting for backend to start...
 timeout /t 5 /nobreak > nul
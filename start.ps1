@@ -8,7 +8,7 @@ Write-Host ""
 
 # Start Backend in WSL (new terminal)
 Write-Host "[1/2] Starting Backend (WSL)..." -ForegroundColor Yellow
-Start-Process wt -ArgumentList "wsl -d Ubuntu -- bash -c `"source ~/.local/bin/env && cd /mnt/c/Users/User/Projects/MedVoice && echo '=== MedVoice Backend ===' && uv run python -m uvicorn backend.app.main:app --host 0.0.0.0 --port 8080`""
+Start-Process wt -ArgumentList "wsl -d Ubuntu -- bash -c `"source ~/.local/bin/env && cd /mnt/c/Users/User/Projects/MedVoice && echo '=== MedVoice Backend ===' && uv run python -m uvicorn backend.app.main:app --host 0.0.0.0 --port 8080 --loop uvloop --http httptools`""
 
 Start-Sleep -Seconds 2
 